@@ -248,6 +248,12 @@ def commit(
         logger.exception(e)
         return
 
+    # Convert the nameIDs once, instead of once per font
+    exclude_namerecords = frozenset(exclude_namerecords)
+    shorten_width = frozenset(shorten_width)
+    shorten_weight = frozenset(shorten_weight)
+    shorten_slope = frozenset(shorten_slope)
+
     for row in data:
         file = Path(row["file_name"])
         if not Path.exists(file):
@@ -265,7 +271,7 @@ def commit(
             logger.opt(colors=True).info(Logs.current_file, file=file)
 
             name_table = font["name"]
-            name_table_copy = deepcopy(name_table)
+            name_table_digest = name_table.get_digest()
             os2_table = font["OS/2"]
             os2_table_copy = copy(os2_table)
             head_table = font["head"]
@@ -300,7 +306,7 @@ def commit(
                 font_has_changed = True
             if head_table != head_table_copy:
                 font_has_changed = True
-            if name_table.compile(font) != name_table_copy.compile(font):
+            if name_table.get_digest() != name_table_digest:
                 font_has_changed = True
             if cff_table_copy:
                 if cff_table_copy.compile(font) != font["CFF "].compile(font):
@@ -139,10 +139,9 @@ def set_names(
             logger.opt(colors=True).info(Logs.current_file, file=file)
 
             cff_table: TableCFF = font["CFF "]
-            cff_table_copy = deepcopy(cff_table)
-            cff_table.set_top_dict_names(params)
-
-            if cff_table.compile(font) != cff_table_copy.compile(font):
+            # The method only writes the values that differ, so there's no need to copy and compile the table to know
+            # if the font has changed
+            if cff_table.set_top_dict_names(params) > 0:
                 font.save(output_file)
                 logger.success(Logs.file_saved, file=output_file)
             else:
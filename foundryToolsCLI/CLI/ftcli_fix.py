@@ -21,6 +21,7 @@ from foundryToolsCLI.Lib.utils.click_tools import (
     add_recursive_option,
     add_common_options,
 )
+from foundryToolsCLI.Lib.utils.copy_tools import fast_deepcopy
 from foundryToolsCLI.Lib.utils.logger import logger, Logs
 from foundryToolsCLI.Lib.utils.skia_tools import is_empty_glyph
 from foundryToolsCLI.Lib.utils.timer import Timer
@@ -398,7 +399,7 @@ def nbsp_width(
             logger.opt(colors=True).info(Logs.checking_file, file=file)
 
             hmtx_table = font["hmtx"]
-            hmtx_table_copy = deepcopy(hmtx_table)
+            hmtx_table_copy = fast_deepcopy(hmtx_table)
 
             best_cmap = font.getBestCmap()
             space_name = best_cmap[0x0020]
@@ -937,7 +938,7 @@ def kern_table(
                 logger.warning(f"{file.name}: The 'kern' table doesn't have any format-0 subtable")
                 continue
 
-            kern_table_copy = deepcopy(kern)
+            kern_table_copy = fast_deepcopy(kern)
 
             character_glyphs = set()
             for table in font["cmap"].tables:
@@ -1008,11 +1009,11 @@ def strip_names(
             logger.opt(colors=True).info(Logs.checking_file, file=file)
 
             name_table: TableName = font["name"]
-            name_table_copy = deepcopy(name_table)
+            name_table_digest = name_table.get_digest()
 
             name_table.remove_leading_trailing_spaces()
 
-            if name_table_copy.compile(font) != name_table.compile(font):
+            if name_table.get_digest() != name_table_digest:
                 font.save(output_file)
                 logger.success(Logs.file_saved, file=output_file)
 
@@ -1062,11 +1063,11 @@ def empty_names(
             logger.opt(colors=True).info(Logs.checking_file, file=file)
 
             name_table: TableName = font["name"]
-            name_table_copy = deepcopy(name_table)
+            name_table_digest = name_table.get_digest()
 
             name_table.remove_empty_names()
 
-            if name_table_copy.compile(font) != name_table.compile(font):
+            if name_table.get_digest() != name_table_digest:
                 font.save(output_file)
                 logger.success(Logs.file_saved, file=output_file)
 
@@ -1,17 +1,25 @@
-from copy import deepcopy
+import os
+import typing as t
 from pathlib import Path
 from typing import Optional
 
 import click
 from fontTools.misc.cliTools import makeOutputFileName
 
+from foundryToolsCLI.Lib.Font import Font
 from foundryToolsCLI.Lib.constants import LANGUAGES_EPILOG
 from foundryToolsCLI.Lib.tables.name import TableName
-from foundryToolsCLI.Lib.utils.cli_tools import get_fonts_in_path, initial_check_pass
+from foundryToolsCLI.Lib.utils.cli_tools import (
+    MappedFile,
+    get_font_paths_in_path,
+    initial_check_pass,
+    run_font_tasks,
+)
 from foundryToolsCLI.Lib.utils.click_tools import (
     add_file_or_path_argument,
     add_recursive_option,
     add_common_options,
+    add_jobs_option,
 )
 from foundryToolsCLI.Lib.utils.logger import logger, Logs
 from foundryToolsCLI.Lib.utils.timer import Timer
@@ -19,6 +27,114 @@ from foundryToolsCLI.Lib.utils.timer import Timer
 tbl_name = click.Group("subcommands")
 
 
+def _edit_name_table(
+    file: Path,
+    edit: t.Callable[..., None],
+    edit_kwargs: dict,
+    output_dir: Optional[Path] = None,
+    overwrite: bool = True,
+    recalc_timestamp: bool = False,
+    needs_edit: Optional[t.Callable[[TableName], bool]] = None,
+) -> tuple[Path, bool]:
+    """
+    Opens a font, applies ``edit(font, name_table, **edit_kwargs)`` to its name table and saves it if the NameRecords
+    have changed. This runs in the worker processes, so it opens the font itself.
+
+    If ``needs_edit`` is given and returns False for the name table, the font is skipped without editing it.
+
+    :return: a tuple containing the output file and a boolean indicating whether the file has been saved
+    """
+    output_file = Path(makeOutputFileName(file, outputDir=output_dir, overWrite=overwrite))
+    # With lazy=True the tables are read from the memory-mapped input file only when needed, instead of loading the
+    # whole file in memory. fontTools doesn't support overwriting a lazily loaded font, and a mapped file can't be
+    # replaced on Windows, so this is only done when saving elsewhere. The paths are compared with samefile(), as
+    # different paths may point to the same file (symlinks, hard links, case-insensitive file systems).
+    if not (output_file.exists() and os.path.samefile(output_file, file)):
+        mapped_file = MappedFile(file)
+        try:
+            font = Font(mapped_file, recalcTimestamp=recalc_timestamp, lazy=True)
+        except Exception:
+            mapped_file.close()
+            raise
+    else:
+        font = Font(file, recalcTimestamp=recalc_timestamp)
+    try:
+        name_table: TableName = font["name"]
+        if needs_edit is not None and not needs_edit(name_table):
+            return output_file, False
+        name_table_digest = name_table.get_digest()
+        edit(font, name_table, **edit_kwargs)
+        if name_table.get_digest() == name_table_digest:
+            return output_file, False
+        font.save(output_file)
+        return output_file, True
+    finally:
+        font.close()
+
+
+def _run_name_table_edit(
+    files: list[Path],
+    edit: t.Callable[..., None],
+    edit_kwargs: dict,
+    jobs: Optional[int] = None,
+    output_dir: Optional[Path] = None,
+    overwrite: bool = True,
+    recalc_timestamp: bool = False,
+    needs_edit: Optional[t.Callable[[TableName], bool]] = None,
+) -> None:
+    """
+    Dispatches the name table edit to the worker processes and logs the results.
+    """
+    for file, result, error in run_font_tasks(
+        _edit_name_table,
+        files,
+        jobs=jobs,
+        edit=edit,
+        edit_kwargs=edit_kwargs,
+        output_dir=output_dir,
+        overwrite=overwrite,
+        recalc_timestamp=recalc_timestamp,
+        needs_edit=needs_edit,
+    ):
+        logger.opt(colors=True).info(Logs.current_file, file=file)
+        if error is not None:
+            logger.opt(exception=error).error(error)
+            continue
+        output_file, saved = result
+        if saved:
+            logger.success(Logs.file_saved, file=output_file)
+        else:
+            logger.skip(Logs.file_not_changed, file=file)
+
+
+def _set_name(font: Font, name_table: TableName, **kwargs) -> None:
+    name_table.add_name(font, **kwargs)
+
+
+def _del_names(_: Font, name_table: TableName, **kwargs) -> None:
+    name_table.del_names(**kwargs)
+
+
+def _find_replace(_: Font, name_table: TableName, **kwargs) -> None:
+    name_table.find_replace(**kwargs)
+
+
+def _has_mac_names(name_table: TableName) -> bool:
+    # Most modern fonts have no Macintosh NameRecords to delete
+    return any(name.platformID == 1 for name in name_table.names)
+
+
+def _del_mac_names(_: Font, name_table: TableName, del_all: bool = False) -> None:
+    name_ids = set(name.nameID for name in name_table.names if name.platformID == 1)
+    if not del_all:
+        name_ids.difference_update((1, 2, 4, 5, 6))
+    name_table.del_names(name_ids=name_ids, platform_id=1)
+
+
+def _append(_: Font, name_table: TableName, **kwargs) -> None:
+    name_table.append_string(**kwargs)
+
+
 @tbl_name.command(epilog=LANGUAGES_EPILOG)
 @add_file_or_path_argument()
 @click.option(
@@ -51,6 +167,7 @@ tbl_name = click.Group("subcommands")
     """,
 )
 @add_recursive_option()
+@add_jobs_option()
 @add_common_options()
 @Timer(logger=logger.info)
 def set_name(
@@ -60,6 +177,7 @@ def set_name(
     string: str,
     language_string: str,
     recursive: bool = False,
+    jobs: Optional[int] = None,
     recalc_timestamp: bool = False,
     output_dir: Optional[Path] = None,
     overwrite: bool = True,
@@ -69,39 +187,27 @@ def set_name(
     it will be overwritten.
     """
 
-    fonts = get_fonts_in_path(
-        input_path=input_path, recursive=recursive, recalc_timestamp=recalc_timestamp
-    )
-    if not initial_check_pass(fonts=fonts, output_dir=output_dir):
+    files = get_font_paths_in_path(input_path=input_path, recursive=recursive)
+    if not initial_check_pass(fonts=files, output_dir=output_dir):
         return
 
     if platform_id:
         platform_id = int(platform_id)
 
-    for font in fonts:
-        try:
-            file = Path(font.reader.file.name)
-            output_file = Path(makeOutputFileName(file, outputDir=output_dir, overWrite=overwrite))
-            logger.opt(colors=True).info(Logs.current_file, file=file)
-
-            name_table: TableName = font["name"]
-            name_table_copy = deepcopy(name_table)
-            name_table.add_name(
-                font,
-                name_id=name_id,
-                string=string,
-                platform_id=platform_id,
-                language_string=language_string,
-            )
-            if name_table_copy.compile(font) != name_table.compile(font):
-                font.save(output_file)
-                logger.success(Logs.file_saved, file=output_file)
-            else:
-                logger.skip(Logs.file_not_changed, file=file)
-        except Exception as e:
-            logger.exception(e)
-        finally:
-            font.close()
+    _run_name_table_edit(
+        files,
+        edit=_set_name,
+        edit_kwargs=dict(
+            name_id=name_id,
+            string=string,
+            platform_id=platform_id,
+            language_string=language_string,
+        ),
+        jobs=jobs,
+        output_dir=output_dir,
+        overwrite=overwrite,
+        recalc_timestamp=recalc_timestamp,
+    )
 
 
 @tbl_name.command(epilog=LANGUAGES_EPILOG)
@@ -141,6 +247,7 @@ def set_name(
     """,
 )
 @add_recursive_option()
+@add_jobs_option()
 @add_common_options()
 @Timer(logger=logger.info)
 def del_names(
@@ -149,6 +256,7 @@ def del_names(
     platform_id: int,
     language_string: str,
     recursive: bool = False,
+    jobs: Optional[int] = None,
     recalc_timestamp: bool = False,
     output_dir: Optional[Path] = None,
     overwrite: bool = True,
@@ -159,39 +267,26 @@ def del_names(
     platformID will be deleted.
     """
 
-    fonts = get_fonts_in_path(
-        input_path=input_path, recursive=recursive, recalc_timestamp=recalc_timestamp
-    )
-    if not initial_check_pass(fonts=fonts, output_dir=output_dir):
+    files = get_font_paths_in_path(input_path=input_path, recursive=recursive)
+    if not initial_check_pass(fonts=files, output_dir=output_dir):
         return
 
     if platform_id:
         platform_id = int(platform_id)
 
-    for font in fonts:
-        try:
-            file = Path(font.reader.file.name)
-            output_file = Path(makeOutputFileName(file, outputDir=output_dir, overWrite=overwrite))
-            logger.opt(colors=True).info(Logs.current_file, file=file)
-
-            name_table: TableName = font["name"]
-            name_table_copy = deepcopy(name_table)
-            name_table.del_names(
-                name_ids=name_ids,
-                platform_id=platform_id,
-                language_string=language_string,
-            )
-
-            if name_table_copy.compile(font) != name_table.compile(font):
-                font.save(output_file)
-                logger.success(Logs.file_saved, file=output_file)
-            else:
-                logger.skip(Logs.file_not_changed, file=file)
-
-        except Exception as e:
-            logger.exception(e)
-        finally:
-            font.close()
+    _run_name_table_edit(
+        files,
+        edit=_del_names,
+        edit_kwargs=dict(
+            name_ids=frozenset(name_ids),
+            platform_id=platform_id,
+            language_string=language_string,
+        ),
+        jobs=jobs,
+        output_dir=output_dir,
+        overwrite=overwrite,
+        recalc_timestamp=recalc_timestamp,
+    )
 
 
 @tbl_name.command()
@@ -235,6 +330,7 @@ def del_names(
     """,
 )
 @add_recursive_option()
+@add_jobs_option()
 @add_common_options()
 @Timer(logger=logger.info)
 def find_replace(
@@ -245,6 +341,7 @@ def find_replace(
     excluded_name_ids: tuple[int],
     platform_id: int,
     recursive: bool = False,
+    jobs: Optional[int] = None,
     recalc_timestamp: bool = False,
     output_dir: Optional[Path] = None,
     overwrite: bool = True,
@@ -253,53 +350,42 @@ def find_replace(
     Finds and replaces a string in the specified NameRecords. If no nameID is specified, the string will be replaced in
     all NameRecords.
     """
-    fonts = get_fonts_in_path(
-        input_path=input_path, recursive=recursive, recalc_timestamp=recalc_timestamp
-    )
-    if not initial_check_pass(fonts=fonts, output_dir=output_dir):
+    files = get_font_paths_in_path(input_path=input_path, recursive=recursive)
+    if not initial_check_pass(fonts=files, output_dir=output_dir):
         return
 
     if platform_id:
         platform_id = int(platform_id)
 
-    for font in fonts:
-        try:
-            file = Path(font.reader.file.name)
-            output_file = Path(makeOutputFileName(file, outputDir=output_dir, overWrite=overwrite))
-            logger.opt(colors=True).info(Logs.current_file, file=file)
-
-            name_table: TableName = font["name"]
-            name_table_copy = deepcopy(name_table)
-            name_table.find_replace(
-                old_string=old_string,
-                new_string=new_string,
-                name_ids_to_include=name_ids,
-                name_ids_to_skip=excluded_name_ids,
-                platform_id=platform_id,
-            )
-
-            if name_table_copy.compile(font) != name_table.compile(font):
-                font.save(output_file)
-                logger.success(Logs.file_saved, file=output_file)
-            else:
-                logger.skip(Logs.file_not_changed, file=file)
-
-        except Exception as e:
-            logger.exception(e)
-        finally:
-            font.close()
+    _run_name_table_edit(
+        files,
+        edit=_find_replace,
+        edit_kwargs=dict(
+            old_string=old_string,
+            new_string=new_string,
+            name_ids_to_include=frozenset(name_ids),
+            name_ids_to_skip=frozenset(excluded_name_ids),
+            platform_id=platform_id,
+        ),
+        jobs=jobs,
+        output_dir=output_dir,
+        overwrite=overwrite,
+        recalc_timestamp=recalc_timestamp,
+    )
 
 
 @tbl_name.command()
 @add_file_or_path_argument()
 @click.option("--del-all", is_flag=True, help="Deletes also nameIDs 1, 2, 4, 5 and 6.")
 @add_recursive_option()
+@add_jobs_option()
 @add_common_options()
 @Timer(logger=logger.info)
 def del_mac_names(
     input_path: Path,
     del_all: bool = False,
     recursive: bool = False,
+    jobs: Optional[int] = None,
     recalc_timestamp: bool = False,
     output_dir: Optional[Path] = None,
     overwrite: bool = True,
@@ -313,40 +399,20 @@ def del_mac_names(
     platformID 3 instead for maximum compatibility. Some legacy software, however, may still require names with
     platformID 1, platformSpecificID 0".
     """
-    fonts = get_fonts_in_path(
-        input_path=input_path, recursive=recursive, recalc_timestamp=recalc_timestamp
-    )
-    if not initial_check_pass(fonts=fonts, output_dir=output_dir):
+    files = get_font_paths_in_path(input_path=input_path, recursive=recursive)
+    if not initial_check_pass(fonts=files, output_dir=output_dir):
         return
 
-    for font in fonts:
-        try:
-            file = Path(font.reader.file.name)
-            output_file = Path(makeOutputFileName(file, outputDir=output_dir, overWrite=overwrite))
-            logger.opt(colors=True).info(Logs.current_file, file=file)
-
-            name_table: TableName = font["name"]
-            name_table_copy = deepcopy(name_table)
-            name_ids = set(name.nameID for name in name_table.names if name.platformID == 1)
-            if not del_all:
-                for n in (1, 2, 4, 5, 6):
-                    try:
-                        name_ids.remove(n)
-                    except KeyError:
-                        pass
-
-            name_table.del_names(name_ids=name_ids, platform_id=1)
-
-            if name_table_copy.compile(font) != name_table.compile(font):
-                font.save(output_file)
-                logger.success(Logs.file_saved, file=output_file)
-            else:
-                logger.skip(Logs.file_not_changed, file=file)
-
-        except Exception as e:
-            logger.exception(e)
-        finally:
-            font.close()
+    _run_name_table_edit(
+        files,
+        edit=_del_mac_names,
+        edit_kwargs=dict(del_all=del_all),
+        jobs=jobs,
+        output_dir=output_dir,
+        overwrite=overwrite,
+        recalc_timestamp=recalc_timestamp,
+        needs_edit=_has_mac_names,
+    )
 
 
 @tbl_name.command(epilog=LANGUAGES_EPILOG)
@@ -385,6 +451,7 @@ def del_mac_names(
 @click.option("--prefix", type=str, help="The string to be prepended to the NameRecords")
 @click.option("--suffix", type=str, help="The suffix to append to the NameRecords")
 @add_recursive_option()
+@add_jobs_option()
 @add_common_options()
 @Timer(logger=logger.info)
 def append(
@@ -395,6 +462,7 @@ def append(
     prefix: str,
     suffix: str,
     recursive: bool = False,
+    jobs: Optional[int] = None,
     recalc_timestamp: bool = False,
     output_dir: Optional[Path] = None,
     overwrite: bool = True,
@@ -409,39 +477,28 @@ def append(
         logger.error("Please, insert at least a prefix or a suffix to append")
         return
 
-    fonts = get_fonts_in_path(
-        input_path=input_path, recursive=recursive, recalc_timestamp=recalc_timestamp
-    )
-    if not initial_check_pass(fonts=fonts, output_dir=output_dir):
+    files = get_font_paths_in_path(input_path=input_path, recursive=recursive)
+    if not initial_check_pass(fonts=files, output_dir=output_dir):
         return
 
     if platform_id:
         platform_id = int(platform_id)
 
-    for font in fonts:
-        try:
-            file = Path(font.reader.file.name)
-            output_file = Path(makeOutputFileName(file, outputDir=output_dir, overWrite=overwrite))
-            logger.opt(colors=True).info(Logs.current_file, file=file)
-
-            name_table: TableName = font["name"]
-            name_table_copy = deepcopy(name_table)
-            name_table.append_string(
-                name_ids=name_ids,
-                platform_id=platform_id,
-                language_string=language_string,
-                prefix=prefix,
-                suffix=suffix,
-            )
-            if name_table.compile(font) != name_table_copy.compile(font):
-                font.save(output_file)
-                logger.success(Logs.file_saved, file=output_file)
-            else:
-                logger.skip(Logs.file_not_changed, file=file)
-        except Exception as e:
-            logger.exception(e)
-        finally:
-            font.close()
+    _run_name_table_edit(
+        files,
+        edit=_append,
+        edit_kwargs=dict(
+            name_ids=frozenset(name_ids),
+            platform_id=platform_id,
+            language_string=language_string,
+            prefix=prefix,
+            suffix=suffix,
+        ),
+        jobs=jobs,
+        output_dir=output_dir,
+        overwrite=overwrite,
+        recalc_timestamp=recalc_timestamp,
+    )
 
 
 cli = click.CommandCollection(
@@ -1,5 +1,5 @@
 import os
-from copy import deepcopy, copy
+from copy import copy
 from pathlib import Path
 from typing import Optional
 
@@ -15,6 +15,7 @@ from foundryToolsCLI.Lib.utils.click_tools import (
     add_recursive_option,
     add_common_options,
 )
+from foundryToolsCLI.Lib.utils.copy_tools import fast_deepcopy
 from foundryToolsCLI.Lib.utils.logger import logger, Logs
 from foundryToolsCLI.Lib.utils.timer import Timer
 
@@ -473,9 +474,9 @@ def set_flags(
             logger.opt(colors=True).info(Logs.current_file, file=file)
 
             head = font["head"]
-            head_copy = deepcopy(head)
+            head_copy = fast_deepcopy(head)
             os2 = font["OS/2"]
-            os2_copy = deepcopy(os2)
+            os2_copy = fast_deepcopy(os2)
 
             for flag, value in params.items():
                 if flag in ("use_typo_metrics", "wws_consistent", "oblique") and os2.version < 4:
@@ -82,8 +82,8 @@ def cli(
             # Process the arguments
             if italic_angle:
                 post_table.set_italic_angle(italic_angle)
-                if font.is_otf:
-                    font["CFF "].cff.topDictIndex[0].ItalicAngle = round(italic_angle)
+                if cff_table is not None:
+                    cff_table.cff.topDictIndex[0].ItalicAngle = round(italic_angle)
 
             if ul_position:
                 post_table.set_underline_position(ul_position)
@@ -171,6 +171,18 @@ def dehint(
     help="""Do not remove hinting.""",
 )
 @click.option("--silent", "verbose", is_flag=True, default=True, help="Run in silent mode")
+@click.option(
+    "--cache",
+    "use_cache",
+    is_flag=True,
+    default=False,
+    help="""
+        Cache the simplified glyphs, so that running the command again on the same fonts is faster.
+
+        The cache is stored in $XDG_CACHE_HOME/foundrytools (~/.cache/foundrytools if the variable is not set) and is
+        never pruned: delete the directory to clear it.
+    """,
+)
 @add_recursive_option()
 @add_common_options()
 @Timer(logger=logger.info)
@@ -179,6 +191,7 @@ def fix_contours(
     min_area: int = 25,
     remove_hinting: bool = True,
     verbose: bool = True,
+    use_cache: bool = False,
     recursive: bool = False,
     output_dir: Optional[Path] = None,
     recalc_timestamp: bool = False,
@@ -204,7 +217,12 @@ def fix_contours(
             output_file = Path(makeOutputFileName(file, outputDir=output_dir, overWrite=overwrite))
             logger.opt(colors=True).info(Logs.checking_file, file=file)
 
-            font.ttf_fix_contours(min_area=min_area, remove_hinting=remove_hinting, verbose=verbose)
+            font.ttf_fix_contours(
+                min_area=min_area,
+                remove_hinting=remove_hinting,
+                verbose=verbose,
+                use_cache=use_cache,
+            )
             font.save(output_file)
             logger.success(Logs.file_saved, file=output_file)
 
@@ -1,7 +1,6 @@
 import os
 import tempfile
 import typing as t
-from copy import deepcopy
 from pathlib import Path
 
 import click
@@ -409,7 +408,7 @@ def set_revision(
 
             if unique_identifier or version_string:
                 name_table: TableName = font["name"]
-                name_table_copy = deepcopy(name_table)
+                name_table_digest = name_table.get_digest()
 
                 if unique_identifier:
                     os2: TableOS2 = font["OS/2"]
@@ -430,7 +429,7 @@ def set_revision(
                         platform_id=platform_id,
                     )
 
-                if name_table_copy.compile(font) != name_table.compile(font):
+                if name_table.get_digest() != name_table_digest:
                     has_changed = True
 
             if has_changed:
@@ -199,9 +199,8 @@ class Font(TTFont):
         os_2: TableOS2 = self["OS/2"]
 
         if value is True:
-            os_2.set_bold_bit()
+            os_2.set_bold_clear_regular_bits()
             head.set_bold_bit()
-            os_2.clear_regular_bit()
         else:
             os_2.clear_bold_bit()
             head.clear_bold_bit()
@@ -216,9 +215,8 @@ class Font(TTFont):
         os_2: TableOS2 = self["OS/2"]
 
         if value is True:
-            os_2.set_italic_bit()
+            os_2.set_italic_clear_regular_bits()
             head.set_italic_bit()
-            os_2.clear_regular_bit()
         else:
             os_2.clear_italic_bit()
             head.clear_italic_bit()
@@ -248,11 +246,8 @@ class Font(TTFont):
         os_2: TableOS2 = self["OS/2"]
 
         if value is True:
-            os_2.set_regular_bit()
-            os_2.clear_bold_bit()
-            os_2.clear_italic_bit()
-            head.clear_bold_bit()
-            head.clear_italic_bit()
+            os_2.set_regular_clear_bold_italic_bits()
+            head.clear_bold_italic_bits()
         else:
             if self.is_bold or self.is_italic:
                 os_2.clear_regular_bit()
@@ -331,11 +326,13 @@ class Font(TTFont):
         y_min = 0
         y_max = 0
         if self.is_otf:
-            y_min = self["head"].yMin
-            y_max = self["head"].yMax
+            head_table: TableHead = self["head"]
+            y_min = head_table.yMin
+            y_max = head_table.yMax
         else:
-            for g in self["glyf"].glyphs:
-                char = self["glyf"][g]
+            glyf_table = self["glyf"]
+            for g in glyf_table.glyphs:
+                char = glyf_table[g]
                 if hasattr(char, "yMin") and y_min > char.yMin:
                     y_min = char.yMin
                 if hasattr(char, "yMax") and y_max < char.yMax:
@@ -541,8 +538,9 @@ class Font(TTFont):
         if not self.is_otf:
             raise NotImplementedError("Setting zones is only supported for PostScript fonts.")
 
-        self["CFF "].cff.topDictIndex[0].Private.BlueValues = blue_values
-        self["CFF "].cff.topDictIndex[0].Private.OtherBlues = other_blues
+        private = self["CFF "].cff.topDictIndex[0].Private
+        private.BlueValues = blue_values
+        private.OtherBlues = other_blues
 
     def set_stems(self, std_h_w: int, std_v_w: int) -> None:
         """
@@ -554,15 +552,24 @@ class Font(TTFont):
         if not self.is_otf:
             raise NotImplementedError("Setting stems is only supported for PostScript fonts.")
 
-        self["CFF "].cff.topDictIndex[0].Private.StdHW = std_h_w
-        self["CFF "].cff.topDictIndex[0].Private.StdVW = std_v_w
+        private = self["CFF "].cff.topDictIndex[0].Private
+        private.StdHW = std_h_w
+        private.StdVW = std_v_w
 
 
     def ttf_fix_contours(
-        self, min_area: int = 25, remove_hinting: bool = True, verbose: bool = False
+        self,
+        min_area: int = 25,
+        remove_hinting: bool = True,
+        verbose: bool = False,
+        use_cache: bool = False,
     ) -> None:
         correct_ttf_contours(
-            self, min_area=min_area, remove_hinting=remove_hinting, verbose=verbose
+            self,
+            min_area=min_area,
+            remove_hinting=remove_hinting,
+            verbose=verbose,
+            use_cache=use_cache,
         )
 
     def add_dummy_dsig(self) -> None:
@@ -660,11 +667,12 @@ class Font(TTFont):
             the vendor code from the font's OS/2 table is returned. If also the vendor code is empty
             or not found, "Unknown" is returned.
         """
-        manufacturer_name: str = self["name"].getDebugName(8)
+        name_table: TableName = self["name"]
+        manufacturer_name: str = name_table.getDebugName(8)
         if manufacturer_name:
             return manufacturer_name
 
-        designer: str = self["name"].getDebugName(9)
+        designer: str = name_table.getDebugName(9)
         if designer:
             return designer
 
@@ -729,12 +737,13 @@ class Font(TTFont):
 
         if "GSUB" not in self:
             return
+        feature_records = self["GSUB"].table.FeatureList.FeatureRecord
         ui_name_ids = self.get_ui_name_ids()
         for count, value in enumerate(ui_name_ids, start=256):
             for n in name_table.names:
                 if n.nameID == value:
                     n.nameID = count
-            for record in self["GSUB"].table.FeatureList.FeatureRecord:
+            for record in feature_records:
                 if record.Feature.FeatureParams:
                     if record.Feature.FeatureParams.UINameID == value:
                         record.Feature.FeatureParams.UINameID = count
@@ -762,11 +771,9 @@ class Font(TTFont):
         os2_typo_ascdesc_delta = os2_typo_ascender + -os2_typo_descender
         hhea_ascdesc_delta = hhea_ascent + -hhea_descent
 
-        # define percent UPM from command line request
-        factor = 1.0 * int(percent) / 100
-
-        # define line spacing units
-        line_spacing_units = int(factor * units_per_em)
+        # define line spacing units as percent UPM from command line request. Integer arithmetic avoids float
+        # rounding errors (e.g. 0.41 * 1200 == 491.99999999999994), percent is never negative
+        line_spacing_units = int(percent) * units_per_em // 100
 
         # define total height as UPM + line spacing units
         total_height = line_spacing_units + units_per_em
@@ -802,14 +809,17 @@ class Font(TTFont):
             os2_win_descent = -hhea_descent
 
         # define updated values from above calculations
-        hhea_table.lineGap = hhea_linegap
-        os2_table.sTypoAscender = os2_typo_ascender
-        os2_table.sTypoDescender = os2_typo_descender
-        os2_table.sTypoLineGap = os2_typo_linegap
-        os2_table.usWinAscent = os2_win_ascent
-        os2_table.usWinDescent = os2_win_descent
-        hhea_table.ascent = hhea_ascent
-        hhea_table.descent = hhea_descent
+        hhea_table.ascent, hhea_table.descent, hhea_table.lineGap = (
+            hhea_ascent,
+            hhea_descent,
+            hhea_linegap,
+        )
+        os2_table.sTypoAscender, os2_table.sTypoDescender, os2_table.sTypoLineGap = (
+            os2_typo_ascender,
+            os2_typo_descender,
+            os2_typo_linegap,
+        )
+        os2_table.usWinAscent, os2_table.usWinDescent = os2_win_ascent, os2_win_descent
 
     def get_font_info(self) -> dict:
         """
@@ -899,11 +909,11 @@ class Font(TTFont):
             italic_angle={"label": "Italic angle", "value": post_table.italicAngle},
             caret_slope_rise={
                 "label": "Caret Slope Rise",
-                "value": self["hhea"].caretSlopeRise,
+                "value": hhea_table.caretSlopeRise,
             },
             caret_slope_run={
                 "label": "Caret Slope Run",
-                "value": self["hhea"].caretSlopeRun,
+                "value": hhea_table.caretSlopeRun,
             },
             caret_offset={"label": "Caret Offset", "value": hhea_table.caretOffset},
             embed_level={
@@ -947,29 +957,33 @@ class Font(TTFont):
         The innermost dictionaries contain a label
         :return: A dictionary with three keys: os2_metrics, hhea_metrics, and head_metrics.
         """
+        os2_table: TableOS2 = self["OS/2"]
+        hhea_table: TableHhea = self["hhea"]
+        head_table: TableHead = self["head"]
+
         font_v_metrics = dict(
             os2_metrics=[
-                {"label": "sTypoAscender", "value": self["OS/2"].sTypoAscender},
-                {"label": "sTypoDescender", "value": self["OS/2"].sTypoDescender},
-                {"label": "sTypoLineGap", "value": self["OS/2"].sTypoLineGap},
-                {"label": "usWinAscent", "value": self["OS/2"].usWinAscent},
-                {"label": "usWinDescent", "value": self["OS/2"].usWinDescent},
+                {"label": "sTypoAscender", "value": os2_table.sTypoAscender},
+                {"label": "sTypoDescender", "value": os2_table.sTypoDescender},
+                {"label": "sTypoLineGap", "value": os2_table.sTypoLineGap},
+                {"label": "usWinAscent", "value": os2_table.usWinAscent},
+                {"label": "usWinDescent", "value": os2_table.usWinDescent},
             ],
             hhea_metrics=[
-                {"label": "ascent", "value": self["hhea"].ascent},
-                {"label": "descent", "value": self["hhea"].descent},
-                {"label": "lineGap", "value": self["hhea"].lineGap},
+                {"label": "ascent", "value": hhea_table.ascent},
+                {"label": "descent", "value": hhea_table.descent},
+                {"label": "lineGap", "value": hhea_table.lineGap},
             ],
             head_metrics=[
-                {"label": "unitsPerEm", "value": self["head"].unitsPerEm},
-                {"label": "xMin", "value": self["head"].xMin},
-                {"label": "yMin", "value": self["head"].yMin},
-                {"label": "xMax", "value": self["head"].xMax},
-                {"label": "yMax", "value": self["head"].yMax},
+                {"label": "unitsPerEm", "value": head_table.unitsPerEm},
+                {"label": "xMin", "value": head_table.xMin},
+                {"label": "yMin", "value": head_table.yMin},
+                {"label": "xMax", "value": head_table.xMax},
+                {"label": "yMax", "value": head_table.yMax},
                 {
                     "label": "Font BBox",
-                    "value": f"({self['head'].xMin}, {self['head'].yMin}) "
-                    f"({self['head'].xMax}, {self['head'].yMax})",
+                    "value": f"({head_table.xMin}, {head_table.yMin}) "
+                    f"({head_table.xMax}, {head_table.yMax})",
                 },
             ],
         )
@@ -985,11 +999,11 @@ class Font(TTFont):
         feature_tags = set[str]()
         for table_tag in ("GSUB", "GPOS"):
             if table_tag in self:
-                if not self[table_tag].table.ScriptList or not self[table_tag].table.FeatureList:
+                table = self[table_tag].table
+                if not table.ScriptList or not table.FeatureList:
                     continue
                 feature_tags.update(
-                    feature_record.FeatureTag
-                    for feature_record in self[table_tag].table.FeatureList.FeatureRecord
+                    feature_record.FeatureTag for feature_record in table.FeatureList.FeatureRecord
                 )
         return sorted(feature_tags)
 
@@ -1030,16 +1044,16 @@ class Font(TTFont):
             return self["head"].unitsPerEm
 
     def calculate_caret_slope_run(self) -> int:
-        if self["post"].italicAngle == 0:
+        italic_angle = self["post"].italicAngle
+        if italic_angle == 0:
             return 0
         else:
-            return round(
-                math.tan(math.radians(-self["post"].italicAngle)) * self["head"].unitsPerEm
-            )
+            return round(math.tan(math.radians(-italic_angle)) * self["head"].unitsPerEm)
 
     def calculate_run_rise_angle(self) -> float:
-        rise = self["hhea"].caretSlopeRise
-        run = self["hhea"].caretSlopeRun
+        hhea_table: TableHhea = self["hhea"]
+        rise = hhea_table.caretSlopeRise
+        run = hhea_table.caretSlopeRun
         run_rise_angle = math.degrees(math.atan(-run / rise))
         return run_rise_angle
 
@@ -1081,12 +1095,12 @@ class Font(TTFont):
         two widths or be zero-width.
         """
         glyph_metrics = self["hmtx"].metrics
+        # getBestCmap() looks up the subtables on every call, so it's called only once
+        best_cmap = self.getBestCmap()
         # NOTE: `range(a, b)` includes `a` and does not include `b`.
         #       Here we don't include 0-31 as well as 127
         #       because these are control characters.
-        ascii_glyph_names = [
-            self.getBestCmap()[c] for c in range(32, 127) if c in self.getBestCmap()
-        ]
+        ascii_glyph_names = [best_cmap[c] for c in range(32, 127) if c in best_cmap]
 
         if len(ascii_glyph_names) > 0.8 * (127 - 32):
             ascii_widths = [
@@ -1105,7 +1119,7 @@ class Font(TTFont):
             # Add character glyphs that are in one of these categories:
             # Letter, Mark, Number, Punctuation, Symbol, Space_Separator.
             # This excludes Line_Separator, Paragraph_Separator and Control.
-            for value, name in self.getBestCmap().items():
+            for value, name in best_cmap.items():
                 if unicodedata.category(chr(value)).startswith(("L", "M", "N", "P", "S", "Zs")):
                     relevant_glyph_names.add(name)
             # Remove character glyphs that are mark glyphs.
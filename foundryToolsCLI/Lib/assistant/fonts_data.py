@@ -19,6 +19,13 @@ from foundryToolsCLI.Lib.tables.name import TableName
 from foundryToolsCLI.Lib.utils.cli_tools import get_fonts_in_path, get_style_mapping_path
 from foundryToolsCLI.Lib.utils.logger import logger, Logs
 
+# Characters removed from the PostScript family and subfamily names: dots, dashes, commas etc., and the characters
+# reserved in PostScript language
+_POSTSCRIPT_NAME_STRIP_TABLE = str.maketrans("", "", ".,:;- []{}<>/%")
+
+# Characters removed from the vendor ID in the Unique identifier: the padding spaces and NULs
+_VEND_ID_STRIP_TABLE = str.maketrans("", "", " \x00")
+
 
 class FontsData(object):
     def __init__(self, fonts_data_file: Path):
@@ -161,10 +168,10 @@ class FontsData(object):
         font: Font,
         row: dict,
         linked_styles: t.Optional[t.Tuple[int, int]] = None,
-        shorten_width: t.Union[t.Tuple[int], t.Tuple[()]] = (),
-        shorten_weight: t.Union[t.Tuple[int], t.Tuple[()]] = (),
-        shorten_slope: t.Union[t.Tuple[int], t.Tuple[()]] = (),
-        exclude_namerecords: t.Union[t.Tuple[int], t.Tuple[()]] = (),
+        shorten_width: t.Collection[int] = (),
+        shorten_weight: t.Collection[int] = (),
+        shorten_slope: t.Collection[int] = (),
+        exclude_namerecords: t.Collection[int] = (),
         width_elidable: str = "Normal",
         weight_elidable: str = "Regular",
         keep_width_elidable: bool = False,
@@ -175,6 +182,13 @@ class FontsData(object):
         auto_shorten: bool = True,
         cff: bool = False,
     ):
+        # The nameIDs are tested for membership many times. frozenset() returns frozensets unchanged, so passing them
+        # avoids building new ones for each font
+        shorten_width = frozenset(shorten_width)
+        shorten_weight = frozenset(shorten_weight)
+        shorten_slope = frozenset(shorten_slope)
+        exclude_namerecords = frozenset(exclude_namerecords)
+
         family_name = row["family_name"]
         is_italic = bool(int(row["is_italic"]))
         is_oblique = bool(int(row["is_oblique"]))
@@ -191,6 +205,21 @@ class FontsData(object):
         name_table: TableName = font["name"]
         head_table: TableHead = font["head"]
 
+        def get_shortenings(
+            name_id: int, width_: bool = True, weight_: bool = True, slope_: bool = True
+        ) -> list[tuple[str, str]]:
+            # Returns the explicitly requested shortenings of a nameID as (long, short) replacements, limited to the
+            # literals that can be in the string
+            return [
+                (long_word, short_word)
+                for long_word, short_word, name_ids, allowed in (
+                    (width, wdt, shorten_width, width_),
+                    (weight, wgt, shorten_weight, weight_),
+                    (slope, slp, shorten_slope, slope_),
+                )
+                if allowed and name_id in name_ids
+            ]
+
         # We clear the bold and italic bits as first. Only the italic and oblique bits values are read from the CSV
         # file. The bold bits will be set only if the -ls / --linked-styles option is active.
         font.set_regular_flag(True)
@@ -215,50 +244,35 @@ class FontsData(object):
         os2_table.set_width_class(us_width_class)
         os2_table.set_weight_class(us_weight_class)
 
-        # Build OT family and subfamily name
-        family_name_ot = f"{family_name} {width}"
-        subfamily_name_ot = weight
-        # Remove width elidable from family name
-        if not keep_width_elidable:
-            if width.lower() == width_elidable.lower():
-                family_name_ot = family_name
-
-        # If super_family is True, prepend the width literal to OT Subfamily Name.
-        if super_family is True:
-            family_name_ot = family_name
-            subfamily_name_ot = f"{width} {weight}"
-            # Remove the width elidable from subfamily name
-            if not keep_width_elidable:
-                if width.lower() == width_elidable.lower():
-                    subfamily_name_ot = weight
-
-        # Finally, append the slope string to subfamily name
-        if len(slope) > 0:
-            subfamily_name_ot = f"{subfamily_name_ot} {slope}"
-            if not keep_weight_elidable:
-                if weight.lower() == weight_elidable.lower():
-                    subfamily_name_ot = (
-                        subfamily_name_ot.replace(weight, "").replace("  ", " ").strip()
-                    )
+        # The elidable width and weight are omitted from the names, unless we want to keep them
+        width_is_elidable = not keep_width_elidable and width.lower() == width_elidable.lower()
+        weight_is_elidable = not keep_weight_elidable and weight.lower() == weight_elidable.lower()
 
+        # Build OT family and subfamily name. The names are built joining the non-empty words, so that there are no
+        # double or trailing spaces to remove.
+        # If super_family is True, the width literal goes in the OT Subfamily Name instead of the Family Name.
+        ot_width = "" if width_is_elidable else width
+        family_name_ot = " ".join(w for w in (family_name, "" if super_family else ot_width) if w)
+        subfamily_words = [w for w in (ot_width if super_family else "", weight, slope) if w]
         # Remove the elidable weight, but only if it's not the only word left.
-        if subfamily_name_ot.lower() != weight.lower():
-            if not keep_weight_elidable:
-                if weight.lower() == weight_elidable.lower():
-                    subfamily_name_ot = (
-                        subfamily_name_ot.replace(weight, "").replace("  ", " ").strip()
-                    )
-
-        # Build Windows family and subfamily names
-        family_name_win = f"{family_name} {width} {weight}"
-        if not keep_width_elidable:
-            if width.lower() == width_elidable.lower():
-                family_name_win = f"{family_name} {weight}"
+        if weight_is_elidable and len(subfamily_words) > 1:
+            subfamily_words = [w for w in subfamily_words if w != weight]
+        subfamily_name_ot = " ".join(subfamily_words)
 
+        # Build Windows family name.
         # When there are both italic and oblique styles in a family, the italic bits are cleared and the oblique bit
         # is set in the oblique style. Consequently, in case the font is oblique, the slope is added to family name.
-        if len(slope) > 0 and is_italic is False:
-            family_name_win = f"{family_name_win} {slope}"
+        # When the -ls / --linked-styles option is active, the linked weights are removed from the family name.
+        family_name_win = " ".join(
+            w
+            for w in (
+                family_name,
+                ot_width,
+                "" if linked_styles and us_weight_class in linked_styles else weight,
+                "" if is_italic else slope,
+            )
+            if w
+        )
 
         # In platformID 3, Subfamily name can be only Regular, Italic, Bold, Bold Italic.
         subfamily_name_win = "Regular"
@@ -266,10 +280,6 @@ class FontsData(object):
             subfamily_name_win = "Italic"
 
         if linked_styles:
-            # Remove Weight from Family Name
-            if us_weight_class in linked_styles:
-                family_name_win = family_name_win.replace(weight, "").replace("  ", " ").strip()
-
             if us_weight_class == linked_styles[1]:
                 # The bold bit is set HERE AND ONLY HERE.
                 font.set_bold_flag(True)
@@ -277,12 +287,8 @@ class FontsData(object):
                 if is_italic is True:
                     subfamily_name_win = "Bold Italic"
 
-        # Apply the explicitly passed shortenings
-        if 1 in shorten_width:
-            family_name_win = family_name_win.replace(width, wdt)
-        if 1 in shorten_weight:
-            family_name_win = family_name_win.replace(weight, wgt)
-        # Slope shouldn't be here, so it is not shortened
+        # Apply the explicitly passed shortenings. Slope shouldn't be here, so it is not shortened
+        family_name_win = self.__shorten_name(family_name_win, get_shortenings(1, slope_=False))
 
         # Check if Windows subfamily name is longer than 27 chars and try ro shorten it.
         if len(family_name_win) > MAX_FAMILY_NAME_LEN and auto_shorten:
@@ -300,28 +306,21 @@ class FontsData(object):
             postscript_family_name = family_name_ot
             postscript_subfamily_name = subfamily_name_ot
 
-            # Apply the explicitly passed shortenings
-            if 6 in shorten_width:
-                if not super_family:
-                    # Width is in the family name string when super_family is False
-                    postscript_family_name = postscript_family_name.replace(width, wdt)
-                else:
-                    # Width is in the subfamily name string when super_family is True
-                    postscript_subfamily_name = postscript_subfamily_name.replace(width, wdt)
-            if 6 in shorten_weight:
-                postscript_subfamily_name = postscript_subfamily_name.replace(weight, wgt)
-            if 6 in shorten_slope:
-                postscript_subfamily_name = postscript_subfamily_name.replace(slope, slp)
-
-            # Remove dots, dashes, commas etc. from PostScript family and subfamily name
-            for char_to_remove in [".", ",", ":", ";", "-", " "]:
-                postscript_family_name = postscript_family_name.replace(char_to_remove, "")
-                postscript_subfamily_name = postscript_subfamily_name.replace(char_to_remove, "")
-
-            # Remove illegal characters. The following characters are reserved in PostScript language.
-            for illegal_char in ("[", "]", "{", "}", "<", ">", "/", "%"):
-                postscript_family_name = postscript_family_name.replace(illegal_char, "")
-                postscript_subfamily_name = postscript_subfamily_name.replace(illegal_char, "")
+            # Apply the explicitly passed shortenings. Width is in the family name string when super_family is False,
+            # and in the subfamily name string when super_family is True
+            postscript_family_name = self.__shorten_name(
+                postscript_family_name,
+                get_shortenings(6, width_=not super_family, weight_=False, slope_=False),
+            )
+            postscript_subfamily_name = self.__shorten_name(
+                postscript_subfamily_name, get_shortenings(6, width_=super_family)
+            )
+
+            # Remove dots, dashes, commas etc. and the illegal characters from PostScript family and subfamily name
+            postscript_family_name = postscript_family_name.translate(_POSTSCRIPT_NAME_STRIP_TABLE)
+            postscript_subfamily_name = postscript_subfamily_name.translate(
+                _POSTSCRIPT_NAME_STRIP_TABLE
+            )
 
             # Finally, build the PostScript Name
             postscript_name = f"{postscript_family_name}-{postscript_subfamily_name}"
@@ -351,18 +350,14 @@ class FontsData(object):
         full_font_name = name_table.getDebugName(4)
 
         if 4 not in exclude_namerecords:
-            full_font_name = f"{family_name_ot} {subfamily_name_ot}"
-
-            # Apply the explicitly passed shortenings
-            if 4 in shorten_width:
-                if not super_family:
-                    full_font_name = f"{family_name_ot.replace(width, wdt)} {subfamily_name_ot}"
-                else:
-                    full_font_name = f"{family_name_ot} {subfamily_name_ot.replace(width, wdt)}"
-            if 4 in shorten_weight:
-                full_font_name = full_font_name.replace(weight, wgt)
-            if 4 in shorten_slope:
-                full_font_name = full_font_name.replace(slope, slp)
+            # Apply the explicitly passed shortenings. Width is shortened only in the family or in the subfamily
+            # name, depending on super_family, while weight and slope are shortened in the whole string
+            width_shortenings = get_shortenings(4, weight_=False, slope_=False)
+            full_font_name = (
+                f"{self.__shorten_name(family_name_ot, width_shortenings if not super_family else [])} "
+                f"{self.__shorten_name(subfamily_name_ot, width_shortenings if super_family else [])}"
+            )
+            full_font_name = self.__shorten_name(full_font_name, get_shortenings(4, width_=False))
 
             # Check if the Full Font Name is longer than 31 chars and try to shorten it.
             if len(full_font_name) > MAX_FULL_NAME_LEN and auto_shorten:
@@ -380,8 +375,9 @@ class FontsData(object):
             )
 
         # Build Unique Identifier
-        ach_vend_id = str(os2_table.achVendID).replace(" ", "").strip("\x00")
-        font_revision = str(round(head_table.fontRevision, 3)).ljust(5, "0")
+        ach_vend_id = str(os2_table.achVendID).translate(_VEND_ID_STRIP_TABLE)
+        # Always three decimals: str(round()).ljust() pads 10.5 to "10.50"
+        font_revision = format(head_table.fontRevision, ".3f")
         unique_id = f"{font_revision};{ach_vend_id};{postscript_name}"
 
         if alt_uid:
@@ -392,79 +388,58 @@ class FontsData(object):
         # Build font revision
         version_string = f"Version {font_revision}"
 
-        # Finally, write the namerecords!
-
-        # nameID 1
-        if 1 not in exclude_namerecords:
-            # Nothing to shorten here. Windows family name is used only here and has already been shortened
-            name_id_1 = family_name_win
-            name_table.add_name(font=font, name_id=1, string=name_id_1)
-
-        # nameID 2
-        if 2 not in exclude_namerecords:
-            # Windows Subfamily Name can be only Regular, Italic, Bold or Bold Italic and can't be shortened.
-            name_id_2 = subfamily_name_win
-            # Maximum length is 31 characters, but since we only use Regular, Italic, Bold and Bold Italic, there's no
-            # need the check if the limit has been exceeded.
-            name_table.add_name(font=font, name_id=2, string=name_id_2)
-
-        # nameID 3
-        if 3 not in exclude_namerecords:
-            # This field has been already calculated and there's nothing to shorten here.
-            name_id_3 = unique_id
-            name_table.add_name(font=font, name_id=3, string=name_id_3)
-
-        # nameID 4
-        if 4 not in exclude_namerecords:
-            # We have already shortened Full Font Name, and eventually auto shortened
-            name_id_4 = full_font_name
-            name_table.add_name(font=font, name_id=4, string=name_id_4)
-
-        # nameID 5
-        if 5 not in exclude_namerecords:
-            # Version string has been already calculated, and there's nothing to shorten here.
-            name_id_5 = version_string
-            name_table.add_name(font=font, name_id=5, string=name_id_5)
-
-        # nameID 6
-        if 6 not in exclude_namerecords:
-            # This field has already been calculated and shortened (and, eventually, auto shortened).
-            name_id_6 = postscript_name
-            name_table.add_name(font=font, name_id=6, string=name_id_6)
+        # Finally, write the namerecords! All these strings have already been calculated and, where needed, shortened
+        # (and eventually auto shortened):
+        #   - nameID 1: the Windows family name is used only here.
+        #   - nameID 2: the Windows subfamily name can be only Regular, Italic, Bold or Bold Italic, so it can't be
+        #     shortened and there's no need to check the 31 characters limit.
+        #   - nameID 3 and nameID 5: there's nothing to shorten here.
+        for name_id, string in (
+            (1, family_name_win),
+            (2, subfamily_name_win),
+            (3, unique_id),
+            (4, full_font_name),
+            (5, version_string),
+            (6, postscript_name),
+        ):
+            if name_id not in exclude_namerecords:
+                name_table.add_name(font=font, name_id=name_id, string=string)
+
+        # The Windows English nameIDs 1 and 2 are the ones just written, unless they have been excluded: there's no
+        # need to look them up in the table.
+        current_name_id_1 = (
+            family_name_win
+            if 1 not in exclude_namerecords
+            else str(name_table.getName(nameID=1, platformID=3, platEncID=1, langID=0x409))
+        )
+        current_name_id_2 = (
+            subfamily_name_win
+            if 2 not in exclude_namerecords
+            else str(name_table.getName(nameID=2, platformID=3, platEncID=1, langID=0x409))
+        )
 
         # nameID 16
         if 16 not in exclude_namerecords:
-            name_id_16 = family_name_ot
-            # Let's apply the explicitly passed shortenings
-            if 16 in shorten_width:
-                # Width literal is here only if super_family is False
-                if not super_family:
-                    name_id_16 = name_id_16.replace(width, wdt)
+            # Let's apply the explicitly passed shortenings. Width literal is here only if super_family is False.
             # Weight and Slope literals shouldn't be here, so they are not shortened.
+            name_id_16 = self.__shorten_name(
+                family_name_ot,
+                get_shortenings(16, width_=not super_family, weight_=False, slope_=False),
+            )
 
             # If nameID 16 is not equal to nameID 1, write it. Otherwise, delete it in case is present.
-            if name_id_16 != str(
-                name_table.getName(nameID=1, platformID=3, platEncID=1, langID=0x409)
-            ):
+            if name_id_16 != current_name_id_1:
                 name_table.add_name(font=font, name_id=16, string=name_id_16)
             else:
                 name_table.del_names(name_ids=[16])
 
         if 17 not in exclude_namerecords:
-            name_id_17 = subfamily_name_ot
-            # Let's apply the explicitly passed shortenings
-            if 17 in shorten_width:
-                # Width literal is here only if super_family is True
-                if super_family:
-                    name_id_17 = name_id_17.replace(width, wdt)
-            if 17 in shorten_weight:
-                name_id_17 = name_id_17.replace(weight, wgt)
-            if 17 in shorten_slope:
-                name_id_17 = name_id_17.replace(slope, slp)
+            # Let's apply the explicitly passed shortenings. Width literal is here only if super_family is True
+            name_id_17 = self.__shorten_name(
+                subfamily_name_ot, get_shortenings(17, width_=super_family)
+            )
             # If nameID 17 is not equal to nameID 2, write it. Otherwise, delete it in case is present.
-            if name_id_17 != str(
-                name_table.getName(nameID=2, platformID=3, platEncID=1, langID=0x409)
-            ):
+            if name_id_17 != current_name_id_2:
                 name_table.add_name(font=font, name_id=17, string=name_id_17)
             else:
                 name_table.del_names(name_ids=[17])
@@ -474,11 +449,28 @@ class FontsData(object):
             cff_family_name = f"{family_name} {width.replace(width_elidable, '')}".strip()
             if keep_width_elidable:
                 cff_family_name = f"{family_name} {width}"
-            font["CFF "].cff.fontNames = [postscript_name]
-            font["CFF "].cff.topDictIndex[0].FullName = full_font_name
+            cff_font = font["CFF "].cff
+            top_dict = cff_font.topDictIndex[0]
+            cff_font.fontNames = [postscript_name]
+            top_dict.FullName = full_font_name
             font.fix_cff_top_dict_version()
-            font["CFF "].cff.topDictIndex[0].FamilyName = cff_family_name
-            font["CFF "].cff.topDictIndex[0].Weight = weight
+            top_dict.FamilyName = cff_family_name
+            top_dict.Weight = weight
+
+    @staticmethod
+    def __shorten_name(string: str, find_replace: t.Iterable[tuple[str, str]]) -> str:
+        """
+        Replaces long words (e.g.: 'ExtraBold', 'Condensed') with short ones (e.g.: 'XBd', 'Cn') in a string.
+
+        :param string: The string to shorten
+        :param find_replace: (long word, short word) tuples, applied in order
+        :return: The shortened string
+        """
+        for long_word, short_word in find_replace:
+            # Skip the no-op replacements: the shortened literal is often the same as the long one, or it's missing
+            if long_word != short_word and long_word in string:
+                string = string.replace(long_word, short_word)
+        return string
 
     @staticmethod
     def __auto_shorten_name(string: str, find_replace: list, max_len: int) -> str:
@@ -497,8 +489,9 @@ class FontsData(object):
         """
         new_string = string
 
-        for i in find_replace:
-            new_string = new_string.replace(i[0], i[1])
+        for long_word, short_word in find_replace:
+            if long_word != short_word and long_word in new_string:
+                new_string = new_string.replace(long_word, short_word)
             if len(new_string) <= max_len:
                 return new_string
 
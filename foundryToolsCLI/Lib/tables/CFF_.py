@@ -34,35 +34,51 @@ class TableCFF(table_C_F_F_):
             except KeyError:
                 pass
 
-    def set_top_dict_names(self, names: dict[str, str]) -> None:
-        top_dict = self.cff.topDictIndex[0]
-        if "fontNames" in names.keys():
-            self.cff.fontNames = [names.get("fontNames")]
-            del names["fontNames"]
+    def set_top_dict_names(self, names: dict[str, str]) -> int:
+        """
+        Sets the CFF fontNames and the topDictIndex[0] names. Values that are already set are not written again.
+
+        :param names: a dictionary mapping the names to set (``fontNames`` or a topDictIndex[0] attribute name) to
+            their values. The dictionary is not modified
+        :return: the number of names that have been changed
+        """
+        cff = self.cff
+        top_dict = cff.topDictIndex[0]
+        count = 0
         for attr_name, attr_value in names.items():
-            setattr(top_dict, attr_name, attr_value)
+            if attr_name == "fontNames":
+                if cff.fontNames != [attr_value]:
+                    cff.fontNames = [attr_value]
+                    count += 1
+            elif getattr(top_dict, attr_name, None) != attr_value:
+                setattr(top_dict, attr_name, attr_value)
+                count += 1
+        return count
 
     def top_dict_find_replace(self, old_string: str, new_string: str) -> None:
-        cff_font_names = self.cff.fontNames[0]
-        self.cff.fontNames = [
-            cff_font_names.replace(old_string, new_string).replace("  ", " ").strip()
-        ]
-        top_dict = self.cff.topDictIndex[0]
-        attr_list = [
-            "version",
-            "FullName",
-            "FamilyName",
-            "Weight",
-            "Copyright",
-            "Notice",
-        ]
-        for attr_name in attr_list:
-            try:
-                old_value = str(getattr(top_dict, attr_name))
-                new_value = old_value.replace(old_string, new_string).replace("  ", " ").strip()
+        """
+        Replaces a string in the CFF fontNames and in the topDictIndex[0] names. Values that don't contain the string
+        are left untouched.
+
+        :param old_string: the string to replace
+        :param new_string: the replacement string
+        """
+        cff = self.cff
+        font_name = cff.fontNames[0]
+        if old_string in font_name:
+            cff.fontNames = [font_name.replace(old_string, new_string).replace("  ", " ").strip()]
+
+        top_dict = cff.topDictIndex[0]
+        for attr_name in ("version", "FullName", "FamilyName", "Weight", "Copyright", "Notice"):
+            old_value = getattr(top_dict, attr_name, None)
+            if old_value is None:
+                continue
+            old_value = str(old_value)
+            if old_string not in old_value:
+                continue
+            new_value = old_value.replace(old_string, new_string).replace("  ", " ").strip()
+            if new_value != old_value:
                 setattr(top_dict, attr_name, new_value)
-            except AttributeError:
-                pass
 
     def get_fb_ps_name(self) -> str:
         """
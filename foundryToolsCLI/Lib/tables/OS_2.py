@@ -5,10 +5,24 @@ from fontTools.ttLib import registerCustomTableClass
 from fontTools.ttLib.tables.O_S_2f_2 import table_O_S_2f_2
 
 from foundryToolsCLI.Lib.constants import PANOSE_STRUCT
-from foundryToolsCLI.Lib.utils.bits_tools import is_nth_bit_set, set_nth_bit, unset_nth_bit
 
 registerCustomTableClass("OS/2", "foundryToolsCLI.Lib.tables.OS_2", "TableOS2")
 
+# fsSelection and fsType bit masks
+_FS_SELECTION_ITALIC = 1 << 0
+_FS_SELECTION_UNDERSCORE = 1 << 1
+_FS_SELECTION_NEGATIVE = 1 << 2
+_FS_SELECTION_OUTLINED = 1 << 3
+_FS_SELECTION_STRIKEOUT = 1 << 4
+_FS_SELECTION_BOLD = 1 << 5
+_FS_SELECTION_REGULAR = 1 << 6
+_FS_SELECTION_USE_TYPO_METRICS = 1 << 7
+_FS_SELECTION_WWS = 1 << 8
+_FS_SELECTION_OBLIQUE = 1 << 9
+_FS_TYPE_EMBED_LEVEL = 0b1111
+_FS_TYPE_NO_SUBSETTING = 1 << 8
+_FS_TYPE_BITMAP_EMBED_ONLY = 1 << 9
+
 
 class TableOS2(table_O_S_2f_2):
     def get_weight_class(self) -> int:
@@ -68,19 +82,19 @@ class TableOS2(table_O_S_2f_2):
 
         :return: A boolean value.
         """
-        return is_nth_bit_set(self.fsSelection, 0)
+        return bool(self.fsSelection & _FS_SELECTION_ITALIC)
 
     def set_italic_bit(self) -> None:
         """
         Sets fsSelection bit 0 (ITALIC)
         """
-        setattr(self, "fsSelection", set_nth_bit(self.fsSelection, 0))
+        self.fsSelection |= _FS_SELECTION_ITALIC
 
     def clear_italic_bit(self) -> None:
         """
         Clears fsSelection bit 0 (ITALIC)
         """
-        setattr(self, "fsSelection", unset_nth_bit(self.fsSelection, 0))
+        self.fsSelection &= ~_FS_SELECTION_ITALIC
 
     def is_bold_bit_set(self) -> bool:
         """
@@ -88,19 +102,19 @@ class TableOS2(table_O_S_2f_2):
 
         :return: A boolean value.
         """
-        return is_nth_bit_set(self.fsSelection, 5)
+        return bool(self.fsSelection & _FS_SELECTION_BOLD)
 
     def set_bold_bit(self) -> None:
         """
         Sets fsSelection bit 5 (BOLD)
         """
-        setattr(self, "fsSelection", set_nth_bit(self.fsSelection, 5))
+        self.fsSelection |= _FS_SELECTION_BOLD
 
     def clear_bold_bit(self) -> None:
         """
         Clears fsSelection bit 5 (BOLD)
         """
-        setattr(self, "fsSelection", unset_nth_bit(self.fsSelection, 5))
+        self.fsSelection &= ~_FS_SELECTION_BOLD
 
     def is_regular_bit_set(self) -> bool:
         """
@@ -108,19 +122,39 @@ class TableOS2(table_O_S_2f_2):
 
         :return: A boolean value.
         """
-        return is_nth_bit_set(self.fsSelection, 6)
+        return bool(self.fsSelection & _FS_SELECTION_REGULAR)
 
     def set_regular_bit(self) -> None:
         """
         Sets fsSelection bit 6 (REGULAR)
         """
-        setattr(self, "fsSelection", set_nth_bit(self.fsSelection, 6))
+        self.fsSelection |= _FS_SELECTION_REGULAR
 
     def clear_regular_bit(self) -> None:
         """
         Clears fsSelection bit 6 (REGULAR)
         """
-        setattr(self, "fsSelection", unset_nth_bit(self.fsSelection, 6))
+        self.fsSelection &= ~_FS_SELECTION_REGULAR
+
+    def set_regular_clear_bold_italic_bits(self) -> None:
+        """
+        Sets fsSelection bit 6 (REGULAR) and clears bits 0 (ITALIC) and 5 (BOLD) in a single write
+        """
+        self.fsSelection = (self.fsSelection | _FS_SELECTION_REGULAR) & ~(
+            _FS_SELECTION_BOLD | _FS_SELECTION_ITALIC
+        )
+
+    def set_bold_clear_regular_bits(self) -> None:
+        """
+        Sets fsSelection bit 5 (BOLD) and clears bit 6 (REGULAR) in a single write
+        """
+        self.fsSelection = (self.fsSelection | _FS_SELECTION_BOLD) & ~_FS_SELECTION_REGULAR
+
+    def set_italic_clear_regular_bits(self) -> None:
+        """
+        Sets fsSelection bit 0 (ITALIC) and clears bit 6 (REGULAR) in a single write
+        """
+        self.fsSelection = (self.fsSelection | _FS_SELECTION_ITALIC) & ~_FS_SELECTION_REGULAR
 
     def is_use_typo_metrics_bit_set(self) -> bool:
         """
@@ -128,7 +162,7 @@ class TableOS2(table_O_S_2f_2):
 
         :return: A boolean value.
         """
-        return is_nth_bit_set(self.fsSelection, 7)
+        return bool(self.fsSelection & _FS_SELECTION_USE_TYPO_METRICS)
 
     def set_use_typo_metrics_bit(self) -> None:
         """
@@ -137,13 +171,13 @@ class TableOS2(table_O_S_2f_2):
         if self.version < 4:
             print("fsSelection bit 7 is only defined in OS/2 version 4 and up.")
             return
-        setattr(self, "fsSelection", set_nth_bit(self.fsSelection, 7))
+        self.fsSelection |= _FS_SELECTION_USE_TYPO_METRICS
 
     def clear_use_typo_metrics_bit(self) -> None:
         """
         Clears fsSelection bit 7 (USE_TYPO_METRICS)
         """
-        setattr(self, "fsSelection", unset_nth_bit(self.fsSelection, 7))
+        self.fsSelection &= ~_FS_SELECTION_USE_TYPO_METRICS
 
     # WWS bit (OS/2.fsSelection bit 8)
 
@@ -153,7 +187,7 @@ class TableOS2(table_O_S_2f_2):
 
         :return: A boolean value.
         """
-        return is_nth_bit_set(self.fsSelection, 8)
+        return bool(self.fsSelection & _FS_SELECTION_WWS)
 
     def set_wws_consistent_bit(self) -> None:
         """
@@ -162,13 +196,13 @@ class TableOS2(table_O_S_2f_2):
         if self.version < 4:
             print("WARNING: fsSelection bit 8 is only defined in OS/2 version 4 and up.")
             return
-        setattr(self, "fsSelection", set_nth_bit(self.fsSelection, 8))
+        self.fsSelection |= _FS_SELECTION_WWS
 
     def clear_wws_consistent_bit(self) -> None:
         """
         Clears fsSelection bit 8 (WWS)
         """
-        setattr(self, "fsSelection", unset_nth_bit(self.fsSelection, 8))
+        self.fsSelection &= ~_FS_SELECTION_WWS
 
     def is_oblique_bit_set(self) -> bool:
         """
@@ -176,7 +210,7 @@ class TableOS2(table_O_S_2f_2):
 
         :return: A boolean value.
         """
-        return is_nth_bit_set(self.fsSelection, 9)
+        return bool(self.fsSelection & _FS_SELECTION_OBLIQUE)
 
     def set_oblique_bit(self) -> None:
         """
@@ -185,49 +219,49 @@ class TableOS2(table_O_S_2f_2):
         if self.version < 4:
             print("WARNING: fsSelection bit 9 is only defined in OS/2 version 4 and up.")
             return
-        setattr(self, "fsSelection", set_nth_bit(self.fsSelection, 9))
+        self.fsSelection |= _FS_SELECTION_OBLIQUE
 
     def clear_oblique_bit(self):
         """
         Clears fsSelection bit 9 (OBLIQUE)
         """
-        setattr(self, "fsSelection", unset_nth_bit(self.fsSelection, 9))
+        self.fsSelection &= ~_FS_SELECTION_OBLIQUE
 
     def is_underscore_bit_set(self) -> bool:
-        return is_nth_bit_set(self.fsSelection, 1)
+        return bool(self.fsSelection & _FS_SELECTION_UNDERSCORE)
 
     def set_underscore_bit(self) -> None:
-        setattr(self, "fsSelection", set_nth_bit(self.fsSelection, 1))
+        self.fsSelection |= _FS_SELECTION_UNDERSCORE
 
     def clear_underscore_bit(self) -> None:
-        setattr(self, "fsSelection", unset_nth_bit(self.fsSelection, 1))
+        self.fsSelection &= ~_FS_SELECTION_UNDERSCORE
 
     def is_negative_bit_set(self) -> bool:
-        return is_nth_bit_set(self.fsSelection, 2)
+        return bool(self.fsSelection & _FS_SELECTION_NEGATIVE)
 
     def set_negative_bit(self) -> None:
-        setattr(self, "fsSelection", set_nth_bit(self.fsSelection, 2))
+        self.fsSelection |= _FS_SELECTION_NEGATIVE
 
     def clear_negative_bit(self) -> None:
-        setattr(self, "fsSelection", unset_nth_bit(self.fsSelection, 2))
+        self.fsSelection &= ~_FS_SELECTION_NEGATIVE
 
     def is_outlined_bit_set(self) -> bool:
-        return is_nth_bit_set(self.fsSelection, 3)
+        return bool(self.fsSelection & _FS_SELECTION_OUTLINED)
 
     def set_outlined_bit(self) -> None:
-        setattr(self, "fsSelection", set_nth_bit(self.fsSelection, 3))
+        self.fsSelection |= _FS_SELECTION_OUTLINED
 
     def clear_outlined_bit(self) -> None:
-        setattr(self, "fsSelection", unset_nth_bit(self.fsSelection, 3))
+        self.fsSelection &= ~_FS_SELECTION_OUTLINED
 
     def is_strikeout_bit_set(self) -> bool:
-        return is_nth_bit_set(self.fsSelection, 4)
+        return bool(self.fsSelection & _FS_SELECTION_STRIKEOUT)
 
     def set_strikeout_bit(self) -> None:
-        setattr(self, "fsSelection", set_nth_bit(self.fsSelection, 4))
+        self.fsSelection |= _FS_SELECTION_STRIKEOUT
 
     def clear_strikeout_bit(self) -> None:
-        setattr(self, "fsSelection", unset_nth_bit(self.fsSelection, 4))
+        self.fsSelection &= ~_FS_SELECTION_STRIKEOUT
 
     # Embed level (OS/2.fsType bits 0-3)
 
@@ -238,23 +272,9 @@ class TableOS2(table_O_S_2f_2):
         :param value: The embedding level you want to set
         :type value: int
         """
-        if value == 0:
-            for b in (0, 1, 2, 3):
-                setattr(self, "fsType", unset_nth_bit(self.fsType, b))
-        elif value == 2:
-            for b in (0, 2, 3):
-                setattr(self, "fsType", unset_nth_bit(self.fsType, b))
-            setattr(self, "fsType", set_nth_bit(self.fsType, 1))
-        elif value == 4:
-            for b in (0, 1, 3):
-                setattr(self, "fsType", unset_nth_bit(self.fsType, b))
-            setattr(self, "fsType", set_nth_bit(self.fsType, 2))
-        elif value == 8:
-            for b in (0, 1, 2):
-                setattr(self, "fsType", unset_nth_bit(self.fsType, b))
-            setattr(self, "fsType", set_nth_bit(self.fsType, 3))
-        else:
-            return
+        # The embedding levels are mutually exclusive: clear bits 0-3 and set the one of the requested level
+        if value in (0, 2, 4, 8):
+            self.fsType = self.fsType & ~_FS_TYPE_EMBED_LEVEL | value
 
     def get_embed_level(self) -> int:
         """
@@ -271,19 +291,19 @@ class TableOS2(table_O_S_2f_2):
 
         :return: A boolean value.
         """
-        return is_nth_bit_set(self.fsType, 8)
+        return bool(self.fsType & _FS_TYPE_NO_SUBSETTING)
 
     def set_no_subsetting_bit(self) -> None:
         """
         Sets fsType bit 8 (NO_SUBSETTING)
         """
-        setattr(self, "fsType", set_nth_bit(self.fsType, 8))
+        self.fsType |= _FS_TYPE_NO_SUBSETTING
 
     def clear_no_subsetting_bit(self) -> None:
         """
         Clears fsType bit 8 (NO_SUBSETTING)
         """
-        setattr(self, "fsType", unset_nth_bit(self.fsType, 8))
+        self.fsType &= ~_FS_TYPE_NO_SUBSETTING
 
     # Bitmap embedding only bit (OS/2.fsType bit 9)
 
@@ -293,19 +313,19 @@ class TableOS2(table_O_S_2f_2):
 
         :return: A boolean value.
         """
-        return is_nth_bit_set(self.fsType, 9)
+        return bool(self.fsType & _FS_TYPE_BITMAP_EMBED_ONLY)
 
     def set_bitmap_embed_only_bit(self) -> None:
         """
         Sets fsType bit 9 (BITMAP_EMBEDDING_ONLY)
         """
-        setattr(self, "fsType", set_nth_bit(self.fsType, 9))
+        self.fsType |= _FS_TYPE_BITMAP_EMBED_ONLY
 
     def clear_bitmap_embed_only_bit(self) -> None:
         """
         Clears fsType bit 9 (BITMAP_EMBEDDING_ONLY)
         """
-        setattr(self, "fsType", unset_nth_bit(self.fsType, 9))
+        self.fsType &= ~_FS_TYPE_BITMAP_EMBED_ONLY
 
     def set_cap_height(self, cap_height: int) -> None:
         """
@@ -1,10 +1,12 @@
 from fontTools.ttLib import registerCustomTableClass
 from fontTools.ttLib.tables._h_e_a_d import table__h_e_a_d
 
-from foundryToolsCLI.Lib.utils.bits_tools import is_nth_bit_set, set_nth_bit, unset_nth_bit
-
 registerCustomTableClass("head", "foundryToolsCLI.Lib.tables.head", "TableHead")
 
+# macStyle bit masks
+_MAC_STYLE_BOLD = 1 << 0
+_MAC_STYLE_ITALIC = 1 << 1
+
 
 class TableHead(table__h_e_a_d):
     def get_font_revision(self) -> float:
@@ -24,19 +26,22 @@ class TableHead(table__h_e_a_d):
         setattr(self, "fontRevision", value)
 
     def is_bold_bit_set(self):
-        return is_nth_bit_set(getattr(self, "macStyle"), 0)
+        return bool(self.macStyle & _MAC_STYLE_BOLD)
 
     def set_bold_bit(self):
-        setattr(self, "macStyle", set_nth_bit(getattr(self, "macStyle"), 0))
+        self.macStyle |= _MAC_STYLE_BOLD
 
     def clear_bold_bit(self):
-        setattr(self, "macStyle", unset_nth_bit(getattr(self, "macStyle"), 0))
+        self.macStyle &= ~_MAC_STYLE_BOLD
 
     def is_italic_bit_set(self):
-        return is_nth_bit_set(getattr(self, "macStyle"), 1)
+        return bool(self.macStyle & _MAC_STYLE_ITALIC)
 
     def set_italic_bit(self):
-        setattr(self, "macStyle", set_nth_bit(getattr(self, "macStyle"), 1))
+        self.macStyle |= _MAC_STYLE_ITALIC
 
     def clear_italic_bit(self):
-        setattr(self, "macStyle", unset_nth_bit(getattr(self, "macStyle"), 1))
+        self.macStyle &= ~_MAC_STYLE_ITALIC
+
+    def clear_bold_italic_bits(self):
+        self.macStyle &= ~(_MAC_STYLE_BOLD | _MAC_STYLE_ITALIC)
@@ -1,14 +1,38 @@
+import functools
+import hashlib
+import struct
+import typing as t
+
 from fontTools.ttLib import registerCustomTableClass
 from fontTools.ttLib.tables._n_a_m_e import (
     table__n_a_m_e,
     NameRecord,
     _MAC_LANGUAGE_CODES,
+    _MAC_LANGUAGE_TO_SCRIPT,
     _WINDOWS_LANGUAGE_CODES,
 )
 
 registerCustomTableClass("name", "foundryToolsCLI.Lib.tables.name", "TableName")
 
 
+@functools.lru_cache(maxsize=64)
+def _get_language_ids(
+    language_string: str,
+) -> tuple[t.Optional[int], t.Optional[int], t.Optional[int]]:
+    """
+    Returns the Windows language ID, the Macintosh language ID and the Macintosh script ID of a language string (e.g.
+    'en'). The values are None if the language is not supported on the platform. The same few languages are looked up
+    for every NameRecord written, so the results are cached.
+    """
+    language_string = language_string.lower()
+    mac_lang_id = _MAC_LANGUAGE_CODES.get(language_string)
+    return (
+        _WINDOWS_LANGUAGE_CODES.get(language_string),
+        mac_lang_id,
+        _MAC_LANGUAGE_TO_SCRIPT.get(mac_lang_id),
+    )
+
+
 class TableName(table__n_a_m_e):
     def add_name(
         self,
@@ -31,9 +55,6 @@ class TableName(table__n_a_m_e):
         :type language_string: str (optional)
         """
 
-        # Remove the NameRecord before writing it to avoid duplicates
-        self.del_names(name_ids=[name_id], platform_id=platform_id, language_string=language_string)
-
         if platform_id == 1:
             mac, windows = True, False
         elif platform_id == 3:
@@ -41,16 +62,60 @@ class TableName(table__n_a_m_e):
         else:
             mac, windows = True, True
 
+        # Nothing to do if the NameRecords that would be written are already there
+        if self._has_names(
+            string, name_id=name_id, mac=mac, windows=windows, language_string=language_string
+        ):
+            return
+
+        # Remove the NameRecord before writing it to avoid duplicates
+        self.del_names(name_ids={name_id}, platform_id=platform_id, language_string=language_string)
+
         names = {language_string: string}
 
         self.addMultilingualName(names, ttFont=font, nameID=name_id, windows=windows, mac=mac)
 
+    def _has_names(
+        self, string: str, name_id: int, mac: bool, windows: bool, language_string: str
+    ) -> bool:
+        """
+        Checks if the NameRecords matching ``name_id`` and ``language_string`` on the requested platforms are exactly
+        the ones that ``addMultilingualName()`` would write for ``string``. Only the plain cases are handled: if the
+        language has no Windows or Macintosh code, False is returned.
+        """
+        win_lang_id, mac_lang_id, mac_script_id = _get_language_ids(language_string)
+        expected = set()
+        if windows:
+            if win_lang_id is None:
+                return False
+            expected.add((3, 1, win_lang_id, string))
+        if mac:
+            if mac_lang_id is None or mac_script_id is None:
+                return False
+            expected.add((1, mac_script_id, mac_lang_id, string))
+
+        names = self.filter_namerecords(
+            name_ids={name_id},
+            platform_id=None if mac and windows else (1 if mac else 3),
+            lang_string=language_string,
+        )
+        return len(names) == len(expected) and expected == {
+            (
+                name.platformID,
+                name.platEncID,
+                name.langID,
+                name.toUnicode(errors="backslashreplace"),
+            )
+            for name in names
+        }
+
     def del_names(self, name_ids, platform_id=None, language_string=None) -> None:
         """
         Deletes all name records that match the given name_ids, optionally filtering by platform_id and/or
         language_string.
 
-        :param name_ids: A list of name IDs to delete
+        :param name_ids: A collection of name IDs to delete. Prefer a set or a frozenset, as it's used for membership
+            tests
         :param platform_id: The platform ID of the name records to delete
         :param language_string: The language of the name records to delete
         """
@@ -58,9 +123,12 @@ class TableName(table__n_a_m_e):
         names = self.filter_namerecords(
             name_ids=name_ids, platform_id=platform_id, lang_string=language_string
         )
+        if not names:
+            return
 
-        for name in names:
-            self.removeNames(name.nameID, name.platformID, name.platEncID, name.langID)
+        # Rebuild the list once, instead of calling removeNames() (which scans the whole list) for each record
+        names_to_delete = {id(name) for name in names}
+        self.names = [name for name in self.names if id(name) not in names_to_delete]
 
     def filter_namerecords(
         self, name_ids=None, platform_id=None, plat_enc_id=None, lang_id=None, lang_string=None
@@ -68,36 +136,36 @@ class TableName(table__n_a_m_e):
         """
         It takes a list of name records, and returns a list of name records that match the given criteria
 
-        :param name_ids: A list of name IDs to filter by
+        :param name_ids: A collection of name IDs to filter by. Prefer a set or a frozenset, as it's used for
+            membership tests
         :param platform_id: The platform ID of the name record
         :param plat_enc_id: The platform-specific encoding ID
         :param lang_id: The language ID of the name record
         :param lang_string: The string to search for in the name records
         :return: A list of name records.
         """
-        filtered_names = self.names
-        if name_ids is not None:
-            filtered_names = [name for name in filtered_names if name.nameID in name_ids]
-        if platform_id is not None:
-            filtered_names = [name for name in filtered_names if name.platformID == platform_id]
-        if plat_enc_id is not None:
-            filtered_names = [name for name in filtered_names if name.platEncID == plat_enc_id]
-        if lang_id is not None:
-            filtered_names = [name for name in filtered_names if name.langID == lang_id]
+        lang_ids = None
         if lang_string is not None:
-            mac_lang_id = _MAC_LANGUAGE_CODES.get(lang_string.lower())
-            win_lang_id = _WINDOWS_LANGUAGE_CODES.get(lang_string.lower())
-            filtered_names = [
-                name for name in filtered_names if name.langID in (mac_lang_id, win_lang_id)
-            ]
-        return filtered_names
+            win_lang_id, mac_lang_id, _ = _get_language_ids(lang_string)
+            lang_ids = {mac_lang_id, win_lang_id}
+
+        # A single pass over the records: the unused criteria cost a cheap identity check each
+        return [
+            name
+            for name in self.names
+            if (name_ids is None or name.nameID in name_ids)
+            and (platform_id is None or name.platformID == platform_id)
+            and (plat_enc_id is None or name.platEncID == plat_enc_id)
+            and (lang_id is None or name.langID == lang_id)
+            and (lang_ids is None or name.langID in lang_ids)
+        ]
 
     def find_replace(
         self,
         old_string: str,
         new_string: str,
-        name_ids_to_include: tuple = (),
-        name_ids_to_skip: tuple = (),
+        name_ids_to_include: t.Collection[int] = (),
+        name_ids_to_skip: t.Collection[int] = (),
         platform_id: int = None,
     ):
         """
@@ -107,36 +175,33 @@ class TableName(table__n_a_m_e):
         :type old_string: str
         :param new_string: The string to replace the old string with
         :type new_string: str
-        :param name_ids_to_include: A tuple of nameIDs to include in the search. If left blank, all nameIDs will be
-            included
-        :type name_ids_to_include: tuple
-        :param name_ids_to_skip: A tuple of nameIDs to skip in the search. If left blank, no nameID will be skipped
-        :type name_ids_to_skip: tuple
+        :param name_ids_to_include: The nameIDs to include in the search. If left blank, all nameIDs will be
+            included. Prefer a set or a frozenset, as it's used for membership tests
+        :type name_ids_to_include: Collection[int]
+        :param name_ids_to_skip: The nameIDs to skip in the search. If left blank, no nameID will be skipped. Prefer
+            a set or a frozenset, as it's used for membership tests
+        :type name_ids_to_skip: Collection[int]
         :param platform_id: The platform ID of the name record to be changed
         :type platform_id: int
         """
 
-        name_ids = [name.nameID for name in self.names]
-
-        if name_ids_to_include != ():
-            name_ids = [name.nameID for name in self.names if name.nameID in name_ids_to_include]
-
-        if name_ids_to_skip != ():
-            name_ids = [name.nameID for name in self.names if name.nameID not in name_ids_to_skip]
+        # The matching NameRecords are modified in place: setName() would look each of them up again in the whole
+        # table, which is quadratic in the number of records
+        names = [
+            name
+            for name in self.filter_namerecords(platform_id=platform_id)
+            if (not name_ids_to_include or name.nameID in name_ids_to_include)
+            and name.nameID not in name_ids_to_skip
+        ]
 
-        names = self.filter_namerecords(name_ids=name_ids, platform_id=platform_id)
-
-        for name in self.names:
-            if name in names:
-                if old_string in str(name):
-                    string = str(name).replace(old_string, new_string).replace("  ", " ").strip()
-                    self.setName(
-                        string,
-                        name.nameID,
-                        name.platformID,
-                        name.platEncID,
-                        name.langID,
-                    )
+        for name in names:
+            # str() decodes the NameRecord on every call
+            old_value = str(name)
+            if old_string not in old_value:
+                continue
+            string = old_value.replace(old_string, new_string).replace("  ", " ").strip()
+            if string != old_value:
+                name.string = string
 
     def append_string(
         self, name_ids, platform_id=None, language_string=None, prefix=None, suffix=None
@@ -145,7 +210,8 @@ class TableName(table__n_a_m_e):
         Appends a prefix, a suffix, or both to the namerecords that match the name IDs, platform ID, and language
         string.
 
-        :param name_ids: A list of name IDs to filter by
+        :param name_ids: A collection of name IDs to filter by. Prefer a set or a frozenset, as it's used for
+            membership tests
         :param platform_id: The platform ID of the namerecords where to append/prepend the string
         :param language_string: The language string to filter by
         :param prefix: The string to be added to the beginning of the namerecords
@@ -163,30 +229,40 @@ class TableName(table__n_a_m_e):
             if suffix is not None:
                 string = f"{string}{suffix}"
 
-            self.setName(
-                string=string,
-                nameID=name.nameID,
-                platformID=name.platformID,
-                platEncID=name.platEncID,
-                langID=name.langID,
-            )
+            name.string = string
 
-    def remove_leading_trailing_spaces(self):
-        for name in self.names:
-            self.setName(
-                str(name).strip(),
-                name.nameID,
+    def get_digest(self) -> bytes:
+        """
+        Returns a digest of the NameRecords in the table. Comparing the digests computed before and after an operation
+        is a cheap way to check if the NameRecords have been modified, without compiling the table.
+
+        :return: A 16 bytes digest of the NameRecords
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        # Records are sorted, as compile() does, so that re-adding an identical record is not seen as a change
+        for platform_id, plat_enc_id, lang_id, name_id, string in sorted(
+            (
                 name.platformID,
                 name.platEncID,
                 name.langID,
+                name.nameID,
+                name.toUnicode(errors="backslashreplace"),
+            )
+            for name in self.names
+        ):
+            data = string.encode("utf-8", "surrogatepass")
+            digest.update(
+                struct.pack(">HHHHI", platform_id, plat_enc_id, lang_id, name_id, len(data))
             )
+            digest.update(data)
+        return digest.digest()
 
-    def remove_empty_names(self):
+    def remove_leading_trailing_spaces(self):
         for name in self.names:
-            if str(name).strip() == "":
-                self.removeNames(
-                    nameID=name.nameID,
-                    platformID=name.platformID,
-                    platEncID=name.platEncID,
-                    langID=name.langID,
-                )
+            old_value = str(name)
+            string = old_value.strip()
+            if string != old_value:
+                name.string = string
+
+    def remove_empty_names(self):
+        self.names = [name for name in self.names if str(name).strip() != ""]
@@ -1,4 +1,4 @@
-def is_nth_bit_set(x: int, n: int):
+def is_nth_bit_set(x: int, n: int) -> bool:
     """
     If the nth bit of an integer x is set, return True, otherwise return False
 
@@ -8,12 +8,10 @@ def is_nth_bit_set(x: int, n: int):
     :type n: int
     :return: Returns True if the nth bit of x is set, and False otherwise.
     """
-    if x & (1 << n):
-        return True
-    return False
+    return bool(x & (1 << n))
 
 
-def set_nth_bit(x: int, n: int):
+def set_nth_bit(x: int, n: int) -> int:
     """
     It takes an integer x and sets the nth bit of x to 1
 
@@ -26,7 +24,7 @@ def set_nth_bit(x: int, n: int):
     return x | 1 << n
 
 
-def unset_nth_bit(x: int, n: int):
+def unset_nth_bit(x: int, n: int) -> int:
     """
     It takes an integer x and clears the nth bit, setting its value to 0
 
@@ -0,0 +1,127 @@
+import hashlib
+import os
+import sqlite3
+import struct
+import typing as t
+from pathlib import Path
+
+import pathops
+from fontTools.ttLib.tables import _g_l_y_f
+
+from foundryToolsCLI.Lib.utils.logger import logger
+
+# Bump this when the output of correct_glyph_contours() changes, to invalidate the stored glyphs
+_SIMPLIFY_CACHE_VERSION = 1
+
+# Stay below the lowest SQLITE_MAX_VARIABLE_NUMBER of the SQLite builds in the wild (999)
+_MAX_QUERY_PARAMETERS = 500
+
+
+def get_cache_dir() -> Path:
+    """
+    Returns the directory where foundryTools-CLI stores its caches: ``$XDG_CACHE_HOME/foundrytools`` if the
+    environment variable is set, ``~/.cache/foundrytools`` otherwise.
+    """
+    cache_home = os.environ.get("XDG_CACHE_HOME")
+    base_dir = Path(cache_home) if cache_home else Path.home() / ".cache"
+    return base_dir / "foundrytools"
+
+
+class SimplifyCache:
+    """
+    A persistent cache of the simple TrueType glyphs fixed by ``correct_glyph_contours()``, so that running the
+    command again on the same font doesn't need to simplify the glyphs with skia-pathops again.
+
+    The glyphs are stored in a SQLite database, which can be safely shared by concurrent processes, keyed on a digest
+    of their outlines. A NULL value means that the glyph doesn't need to be modified. If the database can't be
+    opened, the cache is disabled and all the lookups miss.
+
+    The cache must be used by the thread that created it.
+    """
+
+    def __init__(self, file: t.Optional[Path] = None):
+        self.file = file if file is not None else get_cache_dir() / "simplify-cache.sqlite3"
+        self._connection: t.Optional[sqlite3.Connection] = None
+        try:
+            self.file.parent.mkdir(parents=True, exist_ok=True)
+            connection = sqlite3.connect(self.file, timeout=30)
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS glyphs (key BLOB PRIMARY KEY, data BLOB)"
+            )
+            connection.commit()
+            self._connection = connection
+        except (OSError, sqlite3.Error) as e:
+            logger.warning(f"Cannot open the glyphs cache, it will not be used: {e}")
+
+    def __enter__(self) -> "SimplifyCache":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    @staticmethod
+    def get_key(glyph: _g_l_y_f.Glyph, min_area: int) -> bytes:
+        """
+        Returns the key of a simple glyph: a digest of its outlines and of the parameters that affect the result.
+
+        :param glyph: the simple glyph
+        :param min_area: the minimum area of the paths to keep
+        :return: a 16 bytes digest
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(
+            f"{_SIMPLIFY_CACHE_VERSION}:{getattr(pathops, '__version__', '')}:{min_area}:".encode()
+        )
+        end_points = glyph.endPtsOfContours
+        digest.update(struct.pack(f">{len(end_points)}H", *end_points))
+        digest.update(bytes(glyph.flags))
+        digest.update(glyph.coordinates.array.tobytes())
+        return digest.digest()
+
+    def get_many(self, keys: t.Iterable[bytes]) -> dict[bytes, t.Optional[bytes]]:
+        """
+        Returns the stored glyph data of the given keys. Missing keys are not included in the returned dictionary.
+
+        :param keys: the keys to look up
+        :return: a dictionary mapping the found keys to the compiled glyph data, or to None if the glyph doesn't need
+            to be modified
+        """
+        if self._connection is None:
+            return {}
+
+        keys = list(keys)
+        found = {}
+        try:
+            for i in range(0, len(keys), _MAX_QUERY_PARAMETERS):
+                chunk = keys[i : i + _MAX_QUERY_PARAMETERS]
+                found.update(
+                    self._connection.execute(
+                        f"SELECT key, data FROM glyphs WHERE key IN ({','.join('?' * len(chunk))})",
+                        chunk,
+                    )
+                )
+        except sqlite3.Error as e:
+            logger.warning(f"Cannot read the glyphs cache: {e}")
+        return found
+
+    def set_many(self, items: t.Iterable[tuple[bytes, t.Optional[bytes]]]) -> None:
+        """
+        Stores the compiled data of the glyphs. None means that the glyph doesn't need to be modified.
+
+        :param items: (key, data) tuples
+        """
+        if self._connection is None:
+            return
+
+        try:
+            with self._connection:
+                self._connection.executemany(
+                    "INSERT OR REPLACE INTO glyphs (key, data) VALUES (?, ?)", items
+                )
+        except sqlite3.Error as e:
+            logger.warning(f"Cannot write the glyphs cache: {e}")
+
+    def close(self) -> None:
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
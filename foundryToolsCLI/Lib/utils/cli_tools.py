@@ -1,3 +1,7 @@
+import mmap
+import os
+import typing as t
+from concurrent.futures import ProcessPoolExecutor
 from typing import Optional
 
 from pathlib import Path
@@ -8,6 +12,9 @@ from foundryToolsCLI.Lib.Font import Font
 from foundryToolsCLI.Lib.VFont import VariableFont
 from foundryToolsCLI.Lib.utils.logger import logger
 
+# The first four bytes of TrueType, OpenType-PS, Apple TrueType, WOFF and WOFF2 files
+_FONT_SIGNATURES = (b"\x00\x01\x00\x00", b"OTTO", b"true", b"wOFF", b"wOF2")
+
 
 def get_files_in_path(input_path: Path, recursive: bool = False) -> list[Path]:
     """
@@ -117,11 +124,65 @@ def get_fonts_in_path(
     return fonts
 
 
+def get_font_paths_in_path(input_path: Path, recursive: bool = False) -> list[Path]:
+    """
+    Get a list of font files from a path, without opening them as Font objects. Files are selected by checking their
+    signature only, so the fonts are not parsed until they are actually opened.
+
+    :param input_path: The path to the input file or directory
+    :param recursive: If True, the function will recursively search for fonts in subdirectories
+    :return: A list of pathlib.Path objects representing the font files found in the path
+    """
+    files = get_files_in_path(input_path, recursive=recursive)
+
+    font_paths = []
+    for file in files:
+        try:
+            with open(file, "rb") as f:
+                if f.read(4) in _FONT_SIGNATURES:
+                    font_paths.append(file)
+        except OSError:
+            pass
+
+    return font_paths
+
+
+class MappedFile:
+    """
+    A read-only, memory-mapped file that can be passed to TTFont instead of a path. When the font is opened with
+    ``lazy=True``, the tables are read directly from the mapping, so the OS only pages in the tables that are actually
+    accessed. The mapping is closed when the font is closed.
+
+    The file can't be replaced while it's mapped on Windows, so it must not be used to open fonts that are going to be
+    overwritten.
+    """
+
+    def __init__(self, file: Path):
+        # The mapping keeps its own reference to the file, so the file object can be closed right away
+        with open(file, "rb") as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        # fontTools and this package use reader.file.name to get the path of the font
+        self.name = str(file)
+
+    def read(self, size: int = -1) -> bytes:
+        return self._map.read(size)
+
+    def seek(self, offset: int, whence: int = os.SEEK_SET) -> int:
+        self._map.seek(offset, whence)
+        return self._map.tell()
+
+    def tell(self) -> int:
+        return self._map.tell()
+
+    def close(self) -> None:
+        self._map.close()
+
+
 def initial_check_pass(fonts: list, output_dir: Optional[Path] = None) -> bool:
     """
     Checks if the list of fonts is not empty and if the output directory is writable.
 
-    :param fonts: a list Font objects
+    :param fonts: a list of Font objects or font paths
     :param output_dir: the output directory
     :return: False if one of the checks fails, True if both checks succeed
     """
@@ -139,6 +200,42 @@ def initial_check_pass(fonts: list, output_dir: Optional[Path] = None) -> bool:
     return True
 
 
+def run_font_tasks(
+    task: t.Callable[..., t.Any], files: list[Path], jobs: Optional[int] = None, **kwargs
+) -> t.Iterator[tuple[Path, t.Any, Optional[Exception]]]:
+    """
+    Runs ``task(file, **kwargs)`` for each file. If ``jobs`` is greater than 1 and there is more than one file, the
+    tasks are run in parallel in a pool of processes, otherwise they are run sequentially in the current process.
+
+    The task must be a module-level function, and both its arguments and its return value must be picklable.
+
+    :param task: the function to run for each file
+    :param files: the list of files to process
+    :param jobs: the maximum number of worker processes. Defaults to the number of CPUs
+    :param kwargs: keyword arguments passed to the task
+    :return: an iterator of (file, result, exception) tuples, in the same order as ``files``. If the task raised an
+        exception, result is None and exception is the raised exception, otherwise exception is None
+    """
+    if jobs is None:
+        jobs = os.cpu_count() or 1
+
+    if jobs == 1 or len(files) < 2:
+        for file in files:
+            try:
+                yield file, task(file, **kwargs), None
+            except Exception as e:
+                yield file, None, e
+        return
+
+    with ProcessPoolExecutor(max_workers=min(jobs, len(files))) as executor:
+        futures = [executor.submit(task, file, **kwargs) for file in files]
+        for file, future in zip(files, futures):
+            try:
+                yield file, future.result(), None
+            except Exception as e:
+                yield file, None, e
+
+
 def get_project_files_path(input_path: Path) -> Path:
     """
     Get the path to the directory containing the project files (styles_mapping.json, fonts_data.csv).
@@ -117,6 +117,22 @@ def add_common_options():
     return add_options(_common_options)
 
 
+def add_jobs_option():
+    _jobs_option = [
+        click.option(
+            "-j",
+            "--jobs",
+            type=click.IntRange(min=1),
+            default=None,
+            help="""
+            Number of fonts to process in parallel. Use 1 to process the fonts sequentially. By default, the number
+            of CPUs is used.
+            """,
+        )
+    ]
+    return add_options(_jobs_option)
+
+
 def file_overwrite_prompt(input_file: Path) -> bool:
     return click.confirm(
         f"{click.style(input_file, fg='yellow', bold=True)} already exists. "
@@ -0,0 +1,20 @@
+import copy
+import pickle
+import typing as t
+
+_T = t.TypeVar("_T")
+
+
+def fast_deepcopy(obj: _T) -> _T:
+    """
+    Returns a deep copy of an object. Plain data objects, like most fontTools tables, are copied with a pickle
+    round-trip, which is several times faster than ``copy.deepcopy()``. Objects that can't be pickled (for example,
+    tables holding a reference to the font and its file) are copied with ``copy.deepcopy()``.
+
+    :param obj: the object to copy
+    :return: the copied object
+    """
+    try:
+        return pickle.loads(pickle.dumps(obj, protocol=pickle.HIGHEST_PROTOCOL))
+    except (pickle.PicklingError, TypeError, AttributeError):
+        return copy.deepcopy(obj)
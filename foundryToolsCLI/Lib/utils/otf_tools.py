@@ -29,9 +29,9 @@ def correct_otf_contours(font: TTFont, min_area: int = 25, verbose: bool = False
         glyph_set[k].draw(t2_pen)
         charstrings[k] = t2_pen.getCharString()
 
+        # simplify_path() returns a new path, so there's no need to draw the glyph twice
         path_1 = skia_path_from_glyph(glyph_name=k, glyph_set=glyph_set)
-        path_2 = skia_path_from_glyph(glyph_name=k, glyph_set=glyph_set)
-        path_2 = simplify_path(path=path_2, glyph_name=k, clockwise=False)
+        path_2 = simplify_path(path=path_1, glyph_name=k, clockwise=False)
 
         if min_area > 0:
             path_2 = remove_tiny_paths(
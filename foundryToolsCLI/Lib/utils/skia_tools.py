@@ -1,4 +1,5 @@
 import itertools
+import typing as t
 from collections.abc import Mapping, Callable
 
 import pathops
@@ -78,11 +79,40 @@ def round_path(path: pathops.Path, rounder: Callable[[float], float] = otRound)
     :return: the path with rounded points
     """
     rounded_path = pathops.Path()
-    for verb, points in path:
-        rounded_path.add(verb, *((rounder(p[0]), rounder(p[1])) for p in points))
+    # Read the segments once, round all the coordinates in a single flat pass, then pair them again into points
+    segments = list(path)
+    all_points = itertools.chain.from_iterable(points for _, points in segments)
+    coordinates = map(rounder, itertools.chain.from_iterable(all_points))
+    rounded_points = zip(coordinates, coordinates)
+    add_segment = rounded_path.add
+    for verb, points in segments:
+        add_segment(verb, *itertools.islice(rounded_points, len(points)))
     return rounded_path
 
 
+def _needs_rounding(path: pathops.Path, min_distance: float = 1 / 64) -> bool:
+    """
+    Checks if a pathops.Path has distinct consecutive points with float coordinates closer than ``min_distance``,
+    which is the pattern that makes skia-pathops fail to simplify paths with float coordinates. Coincident points, like
+    retracted off-curve points, don't trigger the bug.
+
+    :param path: the path to check
+    :param min_distance: the minimum distance (Manhattan) between two consecutive points
+    :return: True if the path should be rounded before simplifying it
+    """
+    previous = None
+    for _, points in path:
+        for point in points:
+            if (
+                previous is not None
+                and 0 < abs(point[0] - previous[0]) + abs(point[1] - previous[1]) < min_distance
+                and not all(float(c).is_integer() for c in (*point, *previous))
+            ):
+                return True
+            previous = point
+    return False
+
+
 def simplify_path(path: pathops.Path, glyph_name: str, clockwise: bool) -> pathops.Path:
     """
     Simplify a pathops.Path by removing overlaps, fixing contours direction and, optionally, removing tiny paths
@@ -102,18 +132,27 @@ def simplify_path(path: pathops.Path, glyph_name: str, clockwise: bool) -> patho
     # https://bugs.chromium.org/p/skia/issues/detail?id=11958
     # https://github.com/google/fonts/issues/3365
 
-    try:
-        return pathops.simplify(path, fix_winding=True, clockwise=clockwise)
-    except pathops.PathOpsError:
-        pass
+    # Skip the attempt with float coordinates if the path is known to trigger the bug.
+    needs_rounding = _needs_rounding(path)
+    if not needs_rounding:
+        try:
+            return pathops.simplify(path, fix_winding=True, clockwise=clockwise)
+        except pathops.PathOpsError:
+            pass
 
     path = round_path(path)
     try:
         path = pathops.simplify(path, fix_winding=True, clockwise=clockwise)
-        logger.info(
-            f"skia-pathops failed to simplify glyph '{glyph_name}' with float coordinates, but succeeded using rounded "
-            f"integer coordinates"
-        )
+        if needs_rounding:
+            logger.info(
+                f"Glyph '{glyph_name}' has float coordinates that skia-pathops may fail to simplify, it has been "
+                f"simplified using rounded integer coordinates"
+            )
+        else:
+            logger.info(
+                f"skia-pathops failed to simplify glyph '{glyph_name}' with float coordinates, but succeeded using "
+                f"rounded integer coordinates"
+            )
         return path
     except pathops.PathOpsError as e:
         logger.error(f"skia-pathops failed to simplify glyph '{glyph_name}': {e}")
@@ -123,33 +162,51 @@ def simplify_path(path: pathops.Path, glyph_name: str, clockwise: bool) -> patho
 
 def same_path(path_1: pathops.Path, path_2: pathops.Path) -> bool:
     """
-    Checks if two pathops paths are the same
+    Checks if two pathops paths are the same. The order of the contours is not taken into account.
 
     :param path_1: the first path
     :param path_2: the second path
     :return: True if the paths are the same, False if the paths are different
     """
-    if {tuple(c) for c in path_1.contours} != {tuple(c) for c in path_2.contours}:
-        return False
-    else:
-        return True
+    return {tuple(c) for c in path_1.contours} == {tuple(c) for c in path_2.contours}
+
 
+def ttf_components_overlap(
+    glyph: _g_l_y_f.Glyph,
+    glyph_set: _TTGlyphMapping,
+    path_cache: t.Optional[dict[str, pathops.Path]] = None,
+) -> bool:
+    """
+    Checks if the components of a TrueType composite glyph overlap.
 
-def ttf_components_overlap(glyph: _g_l_y_f.Glyph, glyph_set: _TTGlyphMapping) -> bool:
+    :param glyph: the composite glyph
+    :param glyph_set: the glyphSet to which the glyph belongs
+    :param path_cache: an optional dictionary where the untransformed paths of the base glyphs are cached, so that
+        base glyphs shared by several composites are drawn only once
+    :return: True if at least two components overlap, False otherwise
+    """
     if not glyph.isComposite():
         raise ValueError("This method only works with TrueType composite glyphs")
     if len(glyph.components) < 2:
         return False
 
     component_paths = {}
+    component_bounds = {}
 
     def _get_nth_component_path(index: int) -> pathops.Path:
         if index not in component_paths:
             component_paths[index] = skia_path_from_glyph_component(
-                glyph.components[index], glyph_set
+                glyph.components[index], glyph_set, path_cache=path_cache
             )
         return component_paths[index]
 
+    def _get_nth_component_bounds(index: int) -> tuple[float, float, float, float]:
+        if index not in component_bounds:
+            component_bounds[index] = _get_nth_component_path(index).bounds
+        return component_bounds[index]
+
+    # Components whose bounding boxes don't overlap can't overlap either, so the intersection is computed by
+    # skia-pathops only for the remaining pairs
     return any(
         pathops.op(
             _get_nth_component_path(i),
@@ -160,12 +217,32 @@ def ttf_components_overlap(glyph: _g_l_y_f.Glyph, glyph_set: _TTGlyphMapping) ->
             clockwise=True,
         )
         for i, j in itertools.combinations(range(len(glyph.components)), 2)
+        if _aabb_overlap(_get_nth_component_bounds(i), _get_nth_component_bounds(j))
     )
 
 
-def skia_path_from_glyph_component(component: _g_l_y_f.GlyphComponent, glyph_set: _TTGlyphMapping):
+def _aabb_overlap(
+    a: tuple[float, float, float, float], b: tuple[float, float, float, float]
+) -> bool:
+    """
+    Checks if two axis-aligned bounding boxes, in the (xMin, yMin, xMax, yMax) form, overlap.
+    """
+    return not (a[2] < b[0] or b[2] < a[0] or a[3] < b[1] or b[3] < a[1])
+
+
+def skia_path_from_glyph_component(
+    component: _g_l_y_f.GlyphComponent,
+    glyph_set: _TTGlyphMapping,
+    path_cache: t.Optional[dict[str, pathops.Path]] = None,
+) -> pathops.Path:
     base_glyph_name, transformation = component.getComponentInfo()
-    path = skia_path_from_glyph(base_glyph_name, glyph_set)
+    if path_cache is None:
+        path = skia_path_from_glyph(base_glyph_name, glyph_set)
+    else:
+        path = path_cache.get(base_glyph_name)
+        if path is None:
+            path = path_cache[base_glyph_name] = skia_path_from_glyph(base_glyph_name, glyph_set)
+    # transform() returns a new path, so the cached one is left untouched
     return path.transform(*transformation)
 
 
@@ -1,7 +1,24 @@
+import functools
 from textwrap import TextWrapper
 from typing import Optional
 
 
+@functools.lru_cache(maxsize=32)
+def _get_text_wrapper(
+    width: int, initial_indent: int, indent: int, max_lines: Optional[int]
+) -> TextWrapper:
+    # TextWrapper doesn't keep any state between calls to fill(), so the same instance can wrap all the strings that
+    # share the same parameters, as the rows of a table do
+    return TextWrapper(
+        width=width,
+        initial_indent=" " * initial_indent,
+        subsequent_indent=" " * indent,
+        max_lines=max_lines,
+        break_on_hyphens=False,
+        break_long_words=True,
+    )
+
+
 def wrap_string(
     string: str, width: int, initial_indent: int, indent: int, max_lines: Optional[int] = None
 ) -> str:
@@ -20,12 +37,5 @@ def wrap_string(
     :type max_lines: int
     :return: A string that has been wrapped to the specified width.
     """
-    wrapped_string = TextWrapper(
-        width=width,
-        initial_indent=" " * initial_indent,
-        subsequent_indent=" " * indent,
-        max_lines=max_lines,
-        break_on_hyphens=False,
-        break_long_words=True,
-    ).fill(string)
+    wrapped_string = _get_text_wrapper(width, initial_indent, indent, max_lines).fill(string)
     return wrapped_string
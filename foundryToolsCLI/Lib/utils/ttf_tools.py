@@ -2,12 +2,15 @@
 Adapted code from fontTools.ttLib.removeOverlaps to fix contours direction
 """
 
-from typing import Mapping
+from contextlib import nullcontext
+from typing import Mapping, Optional
 
+import pathops
 from fontTools.ttLib import ttFont
 from fontTools.ttLib.tables import _g_l_y_f
 from fontTools.ttLib.tables import _h_m_t_x
 
+from foundryToolsCLI.Lib.utils.cache_tools import SimplifyCache
 from foundryToolsCLI.Lib.utils.logger import logger
 from foundryToolsCLI.Lib.utils.skia_tools import (
     remove_tiny_paths,
@@ -33,26 +36,25 @@ def correct_glyph_contours(
     hmtx_table: _h_m_t_x.table__h_m_t_x,
     remove_hinting: bool = True,
     min_area: int = 25,
+    path_cache: Optional[dict[str, pathops.Path]] = None,
 ) -> bool:
     glyph = glyf_table[glyph_name]
 
     if (
         glyph.numberOfContours > 0
         or glyph.isComposite()
-        and ttf_components_overlap(glyph, glyph_set)
+        and ttf_components_overlap(glyph, glyph_set, path_cache=path_cache)
     ):
+        # simplify_path() returns a new path, so there's no need to draw the glyph twice
         path_1 = skia_path_from_glyph(glyph_name, glyph_set)
-        path_2 = skia_path_from_glyph(glyph_name, glyph_set)
-        path_2 = simplify_path(path_2, glyph_name, clockwise=True)
+        path_2 = simplify_path(path_1, glyph_name, clockwise=True)
         if min_area > 0:
             path_2 = remove_tiny_paths(path_2, glyph_name=glyph_name, min_area=min_area)
 
         if not same_path(path_1=path_1, path_2=path_2):
-            glyf_table[glyph_name] = glyph = ttf_glyph_from_skia_path(path_2)
+            glyph = ttf_glyph_from_skia_path(path_2)
             assert not glyph.program
-            width, lsb = hmtx_table[glyph_name]
-            if lsb != glyph.xMin:
-                hmtx_table[glyph_name] = (width, glyph.xMin)
+            _replace_glyph(glyph_name, glyph, glyf_table, hmtx_table, path_cache=path_cache)
             return True
 
     if remove_hinting:
@@ -60,12 +62,56 @@ def correct_glyph_contours(
     return False
 
 
+def _replace_glyph(
+    glyph_name: str,
+    glyph: _g_l_y_f.Glyph,
+    glyf_table: _g_l_y_f.table__g_l_y_f,
+    hmtx_table: _h_m_t_x.table__h_m_t_x,
+    path_cache: Optional[dict[str, pathops.Path]] = None,
+) -> None:
+    glyf_table[glyph_name] = glyph
+    if path_cache is not None:
+        path_cache.pop(glyph_name, None)
+    width, lsb = hmtx_table[glyph_name]
+    if lsb != glyph.xMin:
+        hmtx_table[glyph_name] = (width, glyph.xMin)
+
+
+def _get_component_depths(glyf_table, glyph_names: list[str]) -> dict[str, int]:
+    """
+    Returns the component depth of each glyph: 0 for simple glyphs, 1 + the maximum depth of the components for
+    composite glyphs. This is the same value returned by ``getCompositeMaxpValues().maxComponentDepth``, but each glyph
+    is visited only once, instead of walking the whole component tree of every composite.
+
+    :param glyf_table: the ``glyf`` table
+    :param glyph_names: the names of the glyphs
+    :return: a dictionary mapping glyph names to component depths
+    """
+    depths: dict[str, int] = {}
+
+    def _get_depth(glyph_name: str) -> int:
+        depth = depths.get(glyph_name)
+        if depth is None:
+            glyph = glyf_table[glyph_name]
+            if glyph.isComposite():
+                depth = 1 + max(_get_depth(component.glyphName) for component in glyph.components)
+            else:
+                depth = 0
+            depths[glyph_name] = depth
+        return depth
+
+    for name in glyph_names:
+        _get_depth(name)
+    return depths
+
+
 def correct_ttf_contours(
     font: ttFont.TTFont,
     remove_hinting: bool = True,
     ignore_errors: bool = False,
     min_area: int = 25,
     verbose: bool = False,
+    use_cache: bool = False,
 ) -> None:
     try:
         glyf_table = font["glyf"]
@@ -80,31 +126,66 @@ def correct_ttf_contours(
     # process all simple glyphs first, then composites with increasing component depth,
     # so that by the time we test for component intersections the respective base glyphs
     # have already been simplified
-    glyph_names = sorted(
-        glyph_names,
-        key=lambda name: (
-            glyf_table[name].getCompositeMaxpValues(glyf_table).maxComponentDepth
-            if glyf_table[name].isComposite()
-            else 0,
-            name,
-        ),
-    )
-    modified = list()
-    for glyph_name in glyph_names:
+    depths = _get_component_depths(glyf_table, glyph_names)
+    glyph_names = sorted(glyph_names, key=lambda name: (depths[name], name))
+    # Paths of the base glyphs drawn while checking for overlapping components, shared by all the composites
+    path_cache: dict[str, pathops.Path] = {}
+
+    def _correct_glyph_contours(glyph_name: str) -> Optional[bool]:
         try:
-            if correct_glyph_contours(
+            return correct_glyph_contours(
                 glyph_name=glyph_name,
                 glyph_set=glyph_set,
                 glyf_table=glyf_table,
                 hmtx_table=hmtx_table,
                 remove_hinting=remove_hinting,
                 min_area=min_area,
-            ):
-                modified.append(glyph_name)
+                path_cache=path_cache,
+            )
         except CorrectTTFContoursError:
             if not ignore_errors:
                 raise
             logger.error(f"Failed to remove overlaps for '{glyph_name}'")
+            return None
+
+    modified = list()
+    with SimplifyCache() if use_cache else nullcontext() as cache:
+        # Only simple glyphs are cached, as their result depends on their own outlines only
+        cache_keys = {}
+        cached_data = {}
+        if cache is not None:
+            cache_keys = {
+                name: cache.get_key(glyf_table[name], min_area=min_area)
+                for name in glyph_names
+                if glyf_table[name].numberOfContours > 0
+            }
+            cached_data = cache.get_many(cache_keys.values())
+
+        results = []
+        for glyph_name in glyph_names:
+            key = cache_keys.get(glyph_name)
+            if key in cached_data:
+                data = cached_data[key]
+                if data is not None:
+                    glyph = _g_l_y_f.Glyph(data)
+                    glyph.expand(glyf_table)
+                    _replace_glyph(glyph_name, glyph, glyf_table, hmtx_table, path_cache=path_cache)
+                    modified.append(glyph_name)
+                elif remove_hinting:
+                    glyf_table[glyph_name].removeHinting()
+                continue
+
+            is_modified = _correct_glyph_contours(glyph_name)
+            if is_modified:
+                modified.append(glyph_name)
+            # Glyphs that failed are not stored, so they are processed again on the next run
+            if key is not None and is_modified is not None:
+                results.append(
+                    (key, glyf_table[glyph_name].compile(glyf_table) if is_modified else None)
+                )
+
+        if cache is not None:
+            cache.set_many(results)
 
     if verbose:
         modified = sorted(modified)
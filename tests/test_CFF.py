@@ -0,0 +1,47 @@
+import pathlib
+import unittest
+
+from foundryToolsCLI.Lib.Font import Font
+from foundryToolsCLI.Lib.tables.CFF_ import TableCFF
+
+
+class TableCFFTest(unittest.TestCase):
+    def setUp(self):
+        source_file = pathlib.Path.joinpath(pathlib.Path.cwd(), "data", "IBMPlexSerif-Text.otf")
+        self.font = Font(source_file)
+        self.table: TableCFF = self.font["CFF "]
+
+    def tearDown(self):
+        self.font.close()
+
+    def test_set_top_dict_names(self):
+        top_dict = self.table.cff.topDictIndex[0]
+        names = {
+            "fontNames": "NewFont-Regular",
+            "FullName": "New Font Regular",
+            "FamilyName": top_dict.FamilyName,
+        }
+        names_copy = dict(names)
+
+        # FamilyName is already set, so only fontNames and FullName are changed
+        self.assertEqual(self.table.set_top_dict_names(names), 2)
+        self.assertEqual(names, names_copy)
+        self.assertEqual(self.table.cff.fontNames, ["NewFont-Regular"])
+        self.assertEqual(top_dict.FullName, "New Font Regular")
+
+        # Nothing left to change
+        self.assertEqual(self.table.set_top_dict_names(names), 0)
+        self.assertEqual(names, names_copy)
+
+    def test_set_top_dict_names_same_dict_for_several_fonts(self):
+        # The same dictionary is passed for each font by the 'cff set-names' command
+        names = {"fontNames": "NewFont-Regular", "Weight": "Bold"}
+        other_font = Font(self.font.reader.file.name)
+        try:
+            for font in (self.font, other_font):
+                table: TableCFF = font["CFF "]
+                self.assertEqual(table.set_top_dict_names(names), 2)
+                self.assertEqual(table.cff.fontNames, ["NewFont-Regular"])
+                self.assertEqual(table.cff.topDictIndex[0].Weight, "Bold")
+        finally:
+            other_font.close()
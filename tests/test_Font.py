@@ -0,0 +1,52 @@
+import pathlib
+import unittest
+from fractions import Fraction
+
+from foundryToolsCLI.Lib.Font import Font
+
+
+def _float_line_spacing_units(percent: int, units_per_em: int) -> int:
+    # The line spacing units as they were calculated before switching to integer arithmetic
+    factor = 1.0 * int(percent) / 100
+    return int(factor * units_per_em)
+
+
+class FontTest(unittest.TestCase):
+    def test_modify_linegap_percent(self):
+        source_file = pathlib.Path.joinpath(
+            pathlib.Path.cwd(), "data", "IBMPlexSerif-BoldItalic.ttf"
+        )
+        font = Font(source_file)
+        os2_table = font["OS/2"]
+        hhea_table = font["hhea"]
+
+        float_errors = []
+        for units_per_em in (16, 999, 1000, 1001, 1024, 1200, 1234, 2000, 2048, 2049, 4095, 16384):
+            for percent in range(0, 201):
+                font["head"].unitsPerEm = units_per_em
+                # A non-zero sTypoLineGap makes the line gap equal to the line spacing units
+                os2_table.sTypoAscender = 750
+                os2_table.sTypoDescender = -250
+                os2_table.sTypoLineGap = 100
+                hhea_table.ascent, hhea_table.descent, hhea_table.lineGap = 800, -300, 50
+
+                font.modify_linegap_percent(percent)
+
+                line_gap = os2_table.sTypoLineGap
+                self.assertEqual(line_gap, int(Fraction(percent * units_per_em, 100)))
+                self.assertEqual(hhea_table.ascent - hhea_table.descent, units_per_em + line_gap)
+                self.assertEqual(hhea_table.lineGap, 0)
+
+                float_line_gap = _float_line_spacing_units(percent, units_per_em)
+                if line_gap != float_line_gap:
+                    float_errors.append((units_per_em, percent, float_line_gap, line_gap))
+
+        # The results are the same as the float calculation, except where the float product is a hair below an exact
+        # integer and was truncated to the previous one
+        self.assertEqual(
+            [(units_per_em, percent) for units_per_em, percent, _, _ in float_errors],
+            [(1200, p) for p in (41, 57, 69, 82, 113, 114, 138, 139, 163, 164)],
+        )
+        for units_per_em, percent, float_line_gap, line_gap in float_errors:
+            self.assertEqual(percent * units_per_em % 100, 0)
+            self.assertEqual(line_gap, float_line_gap + 1)
@@ -5,6 +5,16 @@ from fontTools.ttLib import newTable
 
 from foundryToolsCLI.Lib.Font import Font
 from foundryToolsCLI.Lib.tables.OS_2 import TableOS2
+from foundryToolsCLI.Lib.tables.head import TableHead
+
+# fsSelection bits 10-15 are reserved, macStyle bits 2-6 are not style bits and bits 7-15 are reserved
+FS_SELECTION_RESERVED = 0b1111110000000000
+FS_SELECTION_ITALIC = 1 << 0
+FS_SELECTION_BOLD = 1 << 5
+FS_SELECTION_REGULAR = 1 << 6
+MAC_STYLE_OTHER = 0b1111111111111100
+MAC_STYLE_BOLD = 1 << 0
+MAC_STYLE_ITALIC = 1 << 1
 
 
 class TableOS2Test(unittest.TestCase):
@@ -130,3 +140,60 @@ class TableOS2Test(unittest.TestCase):
         for i in (0, 2, 4, 8):
             table.set_embed_level(i)
             self.assertEqual(table.get_embed_level(), i)
+
+    def test_combined_bits(self):
+        table: TableOS2 = newTable("OS/2")
+        # The reserved bits, plus USE_TYPO_METRICS, WWS and OBLIQUE
+        other_bits = FS_SELECTION_RESERVED | 1 << 7 | 1 << 8 | 1 << 9
+
+        table.fsSelection = other_bits | FS_SELECTION_BOLD | FS_SELECTION_ITALIC
+        table.set_regular_clear_bold_italic_bits()
+        self.assertEqual(table.fsSelection, other_bits | FS_SELECTION_REGULAR)
+
+        table.fsSelection = other_bits | FS_SELECTION_REGULAR | FS_SELECTION_ITALIC
+        table.set_bold_clear_regular_bits()
+        self.assertEqual(table.fsSelection, other_bits | FS_SELECTION_BOLD | FS_SELECTION_ITALIC)
+
+        table.fsSelection = other_bits | FS_SELECTION_REGULAR
+        table.set_italic_clear_regular_bits()
+        self.assertEqual(table.fsSelection, other_bits | FS_SELECTION_ITALIC)
+
+        head: TableHead = newTable("head")
+        head.macStyle = MAC_STYLE_OTHER | MAC_STYLE_BOLD | MAC_STYLE_ITALIC
+        head.clear_bold_italic_bits()
+        self.assertEqual(head.macStyle, MAC_STYLE_OTHER)
+
+    def test_style_flags_preserve_other_bits(self):
+        source_file = pathlib.Path.joinpath(
+            pathlib.Path.cwd(), "data", "IBMPlexSerif-BoldItalic.ttf"
+        )
+        font = Font(source_file)
+        os_2: TableOS2 = font["OS/2"]
+        head: TableHead = font["head"]
+        os_2.fsSelection |= FS_SELECTION_RESERVED
+        head.macStyle |= MAC_STYLE_OTHER
+        fs_selection_other = os_2.fsSelection & ~(
+            FS_SELECTION_REGULAR | FS_SELECTION_BOLD | FS_SELECTION_ITALIC
+        )
+
+        # Regular
+        font.set_regular_flag(True)
+        self.assertEqual(os_2.fsSelection, fs_selection_other | FS_SELECTION_REGULAR)
+        self.assertEqual(head.macStyle, MAC_STYLE_OTHER)
+
+        # Bold
+        font.set_bold_flag(True)
+        self.assertEqual(os_2.fsSelection, fs_selection_other | FS_SELECTION_BOLD)
+        self.assertEqual(head.macStyle, MAC_STYLE_OTHER | MAC_STYLE_BOLD)
+
+        # Bold Italic
+        font.set_italic_flag(True)
+        self.assertEqual(
+            os_2.fsSelection, fs_selection_other | FS_SELECTION_BOLD | FS_SELECTION_ITALIC
+        )
+        self.assertEqual(head.macStyle, MAC_STYLE_OTHER | MAC_STYLE_BOLD | MAC_STYLE_ITALIC)
+
+        # Italic
+        font.set_bold_flag(False)
+        self.assertEqual(os_2.fsSelection, fs_selection_other | FS_SELECTION_ITALIC)
+        self.assertEqual(head.macStyle, MAC_STYLE_OTHER | MAC_STYLE_ITALIC)
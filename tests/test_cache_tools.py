@@ -0,0 +1,72 @@
+import os
+import pathlib
+import tempfile
+import unittest
+from unittest import mock
+
+from fontTools.ttLib import TTFont
+
+from foundryToolsCLI.Lib.utils import cache_tools, ttf_tools
+from foundryToolsCLI.Lib.utils.cache_tools import SimplifyCache
+
+SOURCE_FILE = pathlib.Path.joinpath(pathlib.Path.cwd(), "data", "IBMPlexSerif-BoldItalic.ttf")
+
+
+class SimplifyCacheTest(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.cache_file = pathlib.Path(self.temp_dir.name, "cache.sqlite3")
+        self.font = TTFont(SOURCE_FILE)
+        self.glyf_table = self.font["glyf"]
+
+    def tearDown(self):
+        self.font.close()
+        self.temp_dir.cleanup()
+
+    def test_miss(self):
+        with SimplifyCache(self.cache_file) as cache:
+            key = cache.get_key(self.glyf_table["a"], min_area=25)
+            self.assertEqual(cache.get_many([key]), {})
+
+    def test_hit(self):
+        with SimplifyCache(self.cache_file) as cache:
+            key_a = cache.get_key(self.glyf_table["a"], min_area=25)
+            key_b = cache.get_key(self.glyf_table["b"], min_area=25)
+            cache.set_many([(key_a, b"data"), (key_b, None)])
+
+        # The glyphs are read back from a new connection
+        with SimplifyCache(self.cache_file) as cache:
+            self.assertEqual(cache.get_many([key_a, key_b]), {key_a: b"data", key_b: None})
+
+    def test_key(self):
+        glyph = self.glyf_table["a"]
+        key = SimplifyCache.get_key(glyph, min_area=25)
+        self.assertEqual(SimplifyCache.get_key(glyph, min_area=25), key)
+        self.assertNotEqual(SimplifyCache.get_key(self.glyf_table["b"], min_area=25), key)
+        self.assertNotEqual(SimplifyCache.get_key(glyph, min_area=0), key)
+        with mock.patch.object(
+            cache_tools, "_SIMPLIFY_CACHE_VERSION", cache_tools._SIMPLIFY_CACHE_VERSION + 1
+        ):
+            self.assertNotEqual(SimplifyCache.get_key(glyph, min_area=25), key)
+
+    def test_failed_glyphs_are_not_stored(self):
+        correct_glyph_contours = ttf_tools.correct_glyph_contours
+
+        def _fail_on_a(glyph_name, **kwargs):
+            if glyph_name == "a":
+                raise ttf_tools.CorrectTTFContoursError()
+            return correct_glyph_contours(glyph_name=glyph_name, **kwargs)
+
+        keys = {
+            name: SimplifyCache.get_key(self.glyf_table[name], min_area=25) for name in ("a", "b")
+        }
+
+        with mock.patch.dict(os.environ, {"XDG_CACHE_HOME": self.temp_dir.name}):
+            with mock.patch.object(ttf_tools, "correct_glyph_contours", side_effect=_fail_on_a):
+                ttf_tools.correct_ttf_contours(self.font, ignore_errors=True, use_cache=True)
+
+            with SimplifyCache() as cache:
+                cached_data = cache.get_many(keys.values())
+
+        self.assertNotIn(keys["a"], cached_data)
+        self.assertIn(keys["b"], cached_data)
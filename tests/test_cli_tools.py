@@ -1,18 +1,30 @@
 import pathlib
 from unittest import TestCase
 
+from fontTools.ttLib import TTFont
+
 from foundryToolsCLI.Lib.utils.cli_tools import (
+    MappedFile,
     get_fonts_in_path,
+    get_font_paths_in_path,
     get_variable_fonts_in_path,
     get_style_mapping_path,
     get_fonts_data_path,
     get_project_files_path,
+    run_font_tasks,
 )
 
 CWD = pathlib.Path.cwd()
 INPUT_PATH = pathlib.Path.joinpath(CWD, "data")
 
 
+# run_font_tasks() pickles the task to send it to the worker processes, so it must be a module-level function
+def _get_file_size(file: pathlib.Path, fail_on: str = None) -> int:
+    if file.name == fail_on:
+        raise ValueError(file.name)
+    return file.stat().st_size
+
+
 class Test(TestCase):
     def test_get_fonts_in_path(self):
         fonts = get_fonts_in_path(input_path=INPUT_PATH)
@@ -34,6 +46,11 @@ class Test(TestCase):
         fonts = get_fonts_in_path(input_path=INPUT_PATH, allow_extensions=[".woff"])
         self.assertEqual(len(fonts), 1)
 
+    def test_get_font_paths_in_path(self):
+        font_paths = get_font_paths_in_path(input_path=INPUT_PATH)
+        self.assertEqual(len(font_paths), 5)
+        self.assertTrue(all(isinstance(p, pathlib.Path) for p in font_paths))
+
     def test_get_variable_fonts_in_path(self):
         variable_fonts = get_variable_fonts_in_path(input_path=INPUT_PATH)
         self.assertEqual(len(variable_fonts), 1)
@@ -52,3 +69,37 @@ class Test(TestCase):
         project_files_path = get_project_files_path(input_path=INPUT_PATH)
         expected = pathlib.Path.joinpath(INPUT_PATH, "ftCLI_files")
         self.assertEqual(project_files_path, expected)
+
+    def test_run_font_tasks(self):
+        files = get_font_paths_in_path(input_path=INPUT_PATH)
+        expected = [(file, file.stat().st_size, None) for file in files]
+        for jobs in (1, 2, None):
+            results = list(run_font_tasks(_get_file_size, files, jobs=jobs))
+            self.assertEqual(results, expected)
+
+    def test_run_font_tasks_exception(self):
+        files = get_font_paths_in_path(input_path=INPUT_PATH)
+        fail_on = files[1].name
+        for jobs in (1, 2):
+            results = list(run_font_tasks(_get_file_size, files, jobs=jobs, fail_on=fail_on))
+            self.assertEqual([file for file, _, _ in results], files)
+            file, result, exception = results[1]
+            self.assertIsNone(result)
+            self.assertIsInstance(exception, ValueError)
+            self.assertEqual(str(exception), fail_on)
+            self.assertTrue(all(e is None for _, _, e in results[:1] + results[2:]))
+
+    def test_mapped_file(self):
+        for file_name in ("IBMPlexSerif-BoldItalic.ttf", "IBMPlexSerif-Text.otf"):
+            file = pathlib.Path.joinpath(INPUT_PATH, file_name)
+            with TTFont(file) as font, TTFont(MappedFile(file), lazy=True) as mapped_font:
+                self.assertEqual(mapped_font.reader.file.name, str(file))
+                self.assertEqual(sorted(mapped_font.keys()), sorted(font.keys()))
+                for tag in font.keys():
+                    if tag == "GlyphOrder":
+                        continue
+                    self.assertEqual(mapped_font.getTableData(tag), font.getTableData(tag), tag)
+                self.assertEqual(
+                    [(n.nameID, n.toUnicode()) for n in mapped_font["name"].names],
+                    [(n.nameID, n.toUnicode()) for n in font["name"].names],
+                )
@@ -0,0 +1,171 @@
+import unittest
+from unittest import mock
+
+from fontTools.ttLib import TTFont, newTable
+from fontTools.ttLib.tables._n_a_m_e import makeName
+
+from foundryToolsCLI.Lib.tables.name import TableName
+
+
+def _new_font() -> TTFont:
+    font = TTFont()
+    font["name"] = newTable("name")
+    font["name"].names = []
+    return font
+
+
+def _get_records(table: TableName) -> list[tuple[int, int, int, int, str]]:
+    return sorted(
+        (n.platformID, n.platEncID, n.langID, n.nameID, n.toUnicode()) for n in table.names
+    )
+
+
+class TableNameTest(unittest.TestCase):
+    def setUp(self):
+        self.font = _new_font()
+        self.table: TableName = self.font["name"]
+
+    def test_add_name(self):
+        self.table.add_name(self.font, "Family", name_id=1)
+        self.assertEqual(
+            _get_records(self.table),
+            [(1, 0, 0, 1, "Family"), (3, 1, 0x409, 1, "Family")],
+        )
+
+    def test_add_name_already_present(self):
+        self.table.add_name(self.font, "Family", name_id=1)
+        names = list(self.table.names)
+        with mock.patch.object(
+            self.table, "addMultilingualName", wraps=self.table.addMultilingualName
+        ) as add_multilingual_name:
+            self.table.add_name(self.font, "Family", name_id=1)
+            self.table.add_name(self.font, "Family", name_id=1, platform_id=1)
+            self.table.add_name(self.font, "Family", name_id=1, platform_id=3)
+            add_multilingual_name.assert_not_called()
+        # The records have not been replaced
+        self.assertEqual(len(self.table.names), len(names))
+        self.assertTrue(all(a is b for a, b in zip(self.table.names, names)))
+
+    def test_add_name_partial_match(self):
+        # Only the Windows record is present, the Macintosh one must be written too
+        self.table.add_name(self.font, "Family", name_id=1, platform_id=3)
+        self.table.add_name(self.font, "Family", name_id=1)
+        self.assertEqual(
+            _get_records(self.table),
+            [(1, 0, 0, 1, "Family"), (3, 1, 0x409, 1, "Family")],
+        )
+
+        # A record with the same nameID on another language is not a match
+        self.table.setName("Famiglia", 1, 3, 1, 0x410)
+        self.table.add_name(self.font, "Family", name_id=1)
+        self.assertIn((3, 1, 0x410, 1, "Famiglia"), _get_records(self.table))
+        self.assertEqual(len(self.table.names), 3)
+
+    def test_add_name_different_string(self):
+        self.table.add_name(self.font, "Family", name_id=1)
+        self.table.add_name(self.font, "Other Family", name_id=1)
+        self.assertEqual(
+            _get_records(self.table),
+            [(1, 0, 0, 1, "Other Family"), (3, 1, 0x409, 1, "Other Family")],
+        )
+
+        # Only the Windows record is rewritten
+        self.table.add_name(self.font, "Family", name_id=1, platform_id=3)
+        self.assertEqual(
+            _get_records(self.table),
+            [(1, 0, 0, 1, "Other Family"), (3, 1, 0x409, 1, "Family")],
+        )
+
+    def test_add_name_unicode_fallback(self):
+        # The string can't be encoded in Mac Roman, so fontTools writes a Unicode (platformID 0) record with the
+        # language in the 'ltag' table instead of a Macintosh one
+        string = "Family 中文"
+        self.table.add_name(self.font, string, name_id=1)
+        records = _get_records(self.table)
+        self.assertEqual(records, [(0, 4, 0, 1, string), (3, 1, 0x409, 1, string)])
+        self.assertEqual(self.font["ltag"].tags, ["en"])
+
+        # Writing it again doesn't add duplicates
+        self.table.add_name(self.font, string, name_id=1)
+        self.assertEqual(_get_records(self.table), records)
+        self.assertEqual(self.font["ltag"].tags, ["en"])
+
+    def test_get_digest(self):
+        self.table.setName("Family", 1, 3, 1, 0x409)
+        self.table.setName("Regular", 2, 3, 1, 0x409)
+        self.table.setName("Family", 1, 1, 0, 0)
+        digest = self.table.get_digest()
+        self.assertEqual(self.table.get_digest(), digest)
+
+        # The order of the records is not taken into account
+        self.table.names.reverse()
+        self.assertEqual(self.table.get_digest(), digest)
+
+        # Changing the string, the nameID or the langID of a record changes the digest
+        name = self.table.getName(1, 3, 1, 0x409)
+        for attr, value in (("string", "Other Family"), ("nameID", 16), ("langID", 0x410)):
+            old_value = getattr(name, attr)
+            setattr(name, attr, value)
+            self.assertNotEqual(self.table.get_digest(), digest, attr)
+            setattr(name, attr, old_value)
+            self.assertEqual(self.table.get_digest(), digest, attr)
+
+        # Adding or removing a record changes the digest
+        self.table.setName("Bold", 2, 1, 0, 0)
+        self.assertNotEqual(self.table.get_digest(), digest)
+        self.table.removeNames(nameID=2, platformID=1)
+        self.assertEqual(self.table.get_digest(), digest)
+        self.table.removeNames(nameID=2)
+        self.assertNotEqual(self.table.get_digest(), digest)
+
+    def _add_find_replace_names(self):
+        for name_id in (1, 4, 6, 16):
+            self.table.setName("Family Old", name_id, 3, 1, 0x409)
+            self.table.setName("Family Old", name_id, 1, 0, 0)
+
+    def _get_replaced(self) -> set[tuple[int, int]]:
+        return {(n.platformID, n.nameID) for n in self.table.names if n.toUnicode() == "Family New"}
+
+    def test_find_replace(self):
+        self._add_find_replace_names()
+        self.table.find_replace("Old", "New")
+        self.assertEqual(self._get_replaced(), {(p, n) for p in (1, 3) for n in (1, 4, 6, 16)})
+
+        self.table.names = []
+        self._add_find_replace_names()
+        self.table.find_replace("Old", "New", platform_id=3)
+        self.assertEqual(self._get_replaced(), {(3, n) for n in (1, 4, 6, 16)})
+
+    def test_find_replace_include_skip(self):
+        # Include only
+        self._add_find_replace_names()
+        self.table.find_replace("Old", "New", name_ids_to_include={1, 4})
+        self.assertEqual(self._get_replaced(), {(p, n) for p in (1, 3) for n in (1, 4)})
+
+        # Skip only
+        self.table.names = []
+        self._add_find_replace_names()
+        self.table.find_replace("Old", "New", name_ids_to_skip={1, 4})
+        self.assertEqual(self._get_replaced(), {(p, n) for p in (1, 3) for n in (6, 16)})
+
+        # Both: the included nameIDs that are not skipped
+        self.table.names = []
+        self._add_find_replace_names()
+        self.table.find_replace(
+            "Old", "New", name_ids_to_include={1, 4, 6}, name_ids_to_skip={4, 16}
+        )
+        self.assertEqual(self._get_replaced(), {(p, n) for p in (1, 3) for n in (1, 6)})
+
+    def test_find_replace_in_place(self):
+        self._add_find_replace_names()
+        # A duplicate record: setName() would always modify the first one
+        duplicate = makeName("Other Old", 1, 3, 1, 0x409)
+        self.table.names.append(duplicate)
+        names = list(self.table.names)
+
+        self.table.find_replace("Old", "New  ")
+        # The records are modified in place, and the double spaces and the trailing spaces are removed
+        self.assertEqual(len(self.table.names), len(names))
+        self.assertTrue(all(a is b for a, b in zip(self.table.names, names)))
+        self.assertEqual(duplicate.toUnicode(), "Other New")
+        self.assertEqual(len(self._get_replaced()), 8)
@@ -0,0 +1,73 @@
+import unittest
+
+import pathops
+
+from foundryToolsCLI.Lib.utils.skia_tools import _needs_rounding, same_path
+
+
+def _rectangle(x_min: float, y_min: float, x_max: float, y_max: float) -> pathops.Path:
+    path = pathops.Path()
+    path.moveTo(x_min, y_min)
+    path.lineTo(x_min, y_max)
+    path.lineTo(x_max, y_max)
+    path.lineTo(x_max, y_min)
+    path.close()
+    return path
+
+
+def _join(*paths: pathops.Path) -> pathops.Path:
+    path = pathops.Path()
+    for p in paths:
+        path.addPath(p)
+    return path
+
+
+class SkiaToolsTest(unittest.TestCase):
+    def test_same_path(self):
+        path_1 = _join(_rectangle(0, 0, 100, 100), _rectangle(200, 0, 300, 100))
+        path_2 = _join(_rectangle(0, 0, 100, 100), _rectangle(200, 0, 300, 100))
+        self.assertTrue(same_path(path_1, path_2))
+
+        # Different points
+        path_2 = _join(_rectangle(0, 0, 100, 100), _rectangle(200, 0, 300, 101))
+        self.assertFalse(same_path(path_1, path_2))
+
+        # Missing contour
+        path_2 = _rectangle(0, 0, 100, 100)
+        self.assertFalse(same_path(path_1, path_2))
+
+    def test_same_path_ignores_contours_order(self):
+        path_1 = _join(_rectangle(0, 0, 100, 100), _rectangle(200, 0, 300, 100))
+        path_2 = _join(_rectangle(200, 0, 300, 100), _rectangle(0, 0, 100, 100))
+        self.assertTrue(same_path(path_1, path_2))
+
+    def test_same_path_negative_zero(self):
+        path_1 = _rectangle(0, 0, 100, 100)
+        path_2 = _rectangle(-0.0, -0.0, 100, 100)
+        self.assertTrue(same_path(path_1, path_2))
+
+    def test_needs_rounding(self):
+        # Two distinct points with float coordinates closer than 1/64
+        path = pathops.Path()
+        path.moveTo(0.5, 0)
+        path.lineTo(0.5, 100)
+        path.cubicTo(0.5, 100.005, 50.5, 150, 100.5, 100)
+        path.close()
+        self.assertTrue(_needs_rounding(path))
+
+    def test_needs_rounding_retracted_handles(self):
+        # Off-curve points that coincide with their on-curve points (retracted handles) don't trigger the bug
+        path = pathops.Path()
+        path.moveTo(0.5, 0)
+        path.lineTo(0.5, 100)
+        path.cubicTo(0.5, 100, 100.5, 100, 100.5, 100)
+        path.close()
+        self.assertFalse(_needs_rounding(path))
+
+    def test_needs_rounding_integer_coordinates(self):
+        path = pathops.Path()
+        path.moveTo(0, 0)
+        path.lineTo(0, 100)
+        path.lineTo(100, 100)
+        path.close()
+        self.assertFalse(_needs_rounding(path))